@@ -1,73 +1,77 @@
 # =====================================================================
-# algorithms/__init__.py — Carga segura de todos los algoritmos
+# algorithms/__init__.py — Carga segura (y diferida) de los algoritmos
 # =====================================================================
-# Este archivo importa cada algoritmo de su módulo individual.
+# Cada algoritmo vive en su módulo individual y se importa recién la
+# primera vez que se pide (por ejemplo `from algorithms import bfs_pasos`
+# o `algoritmo_disponible('bfs')`), así `import algorithms` es casi
+# gratuito.
+#
 # Si algún módulo tiene un error de sintaxis o dependencia faltante,
 # se atrapa la excepción y se registra en ERRORES_CARGA, pero el
 # resto de la aplicación sigue funcionando normalmente.
 #
 # Así, un bug en (por ejemplo) bellman_ford.py NO rompe BFS ni Dijkstra.
+#
+# Para ver en consola el resumen de carga, definir la variable de
+# entorno DEBUG (p. ej. `DEBUG=1 python main.py`).
 # =====================================================================
 
+import importlib
+import os
 import traceback
 
+# Utilidades compartidas para reconstruir el estado a partir de los
+# pasos con deltas (no dependen de ningún algoritmo en particular).
+from algorithms.pasos import ColumnasPasos, ReproductorPasos, materializar_pasos
+
 # Diccionario donde se registran los errores de carga.
 # Clave: nombre del algoritmo, Valor: mensaje de error.
 ERRORES_CARGA = {}
 
-# ---- BFS ----
-try:
-    from algorithms.bfs import bfs_pasos
-except Exception as e:
-    ERRORES_CARGA['bfs'] = traceback.format_exc()
-    bfs_pasos = None
-
-# ---- DFS ----
-try:
-    from algorithms.dfs import dfs_pasos
-except Exception as e:
-    ERRORES_CARGA['dfs'] = traceback.format_exc()
-    dfs_pasos = None
-
-# ---- Dijkstra ----
-try:
-    from algorithms.dijkstra import dijkstra_pasos
-except Exception as e:
-    ERRORES_CARGA['dijkstra'] = traceback.format_exc()
-    dijkstra_pasos = None
-
-# ---- A* ----
-try:
-    from algorithms.a_star import a_star_pasos
-except Exception as e:
-    ERRORES_CARGA['astar'] = traceback.format_exc()
-    a_star_pasos = None
-
-# ---- Bellman-Ford ----
-try:
-    from algorithms.bellman_ford import bellman_ford_pasos
-except Exception as e:
-    ERRORES_CARGA['bellman'] = traceback.format_exc()
-    bellman_ford_pasos = None
-
-# ---- Kruskal ----
-try:
-    from algorithms.kruskal import kruskal_pasos
-except Exception as e:
-    ERRORES_CARGA['kruskal'] = traceback.format_exc()
-    kruskal_pasos = None
-
-# ---- Prim ----
-try:
-    from algorithms.prim import prim_pasos
-except Exception as e:
-    ERRORES_CARGA['prim'] = traceback.format_exc()
-    prim_pasos = None
+# Algoritmos disponibles: clave → (módulo, función que exporta)
+_ALGORITMOS = {
+    'bfs':      ('algorithms.bfs', 'bfs_pasos'),
+    'dfs':      ('algorithms.dfs', 'dfs_pasos'),
+    'dijkstra': ('algorithms.dijkstra', 'dijkstra_pasos'),
+    'astar':    ('algorithms.a_star', 'a_star_pasos'),
+    'bellman':  ('algorithms.bellman_ford', 'bellman_ford_pasos'),
+    'kruskal':  ('algorithms.kruskal', 'kruskal_pasos'),
+    'prim':     ('algorithms.prim', 'prim_pasos'),
+}
+
+# Índice inverso: nombre de la función → clave del algoritmo
+_CLAVE_POR_FUNCION = {funcion: clave for clave, (_, funcion) in _ALGORITMOS.items()}
+
+
+def _cargar(clave):
+    """
+    Importa el módulo de un algoritmo y publica su función en este
+    paquete. Si falla, registra el error y publica None en su lugar.
+    """
+    modulo, funcion = _ALGORITMOS[clave]
+    try:
+        valor = getattr(importlib.import_module(modulo), funcion)
+    except Exception:
+        ERRORES_CARGA[clave] = traceback.format_exc()
+        valor = None
+    # Guardar en el namespace del paquete: los accesos siguientes ya no
+    # pasan por __getattr__
+    globals()[funcion] = valor
+    return valor
+
+
+def __getattr__(nombre):
+    """Carga diferida de bfs_pasos, dfs_pasos, etc. en el primer acceso."""
+    clave = _CLAVE_POR_FUNCION.get(nombre)
+    if clave is None:
+        raise AttributeError(f"module 'algorithms' has no attribute {nombre!r}")
+    return _cargar(clave)
 
 
 def algoritmo_disponible(nombre):
     """
     Verifica si un algoritmo se cargó correctamente.
+    Si todavía no se había importado, lo importa en este momento.
 
     Parámetro:
         nombre: clave del algoritmo ('bfs', 'dfs', 'dijkstra', etc.)
@@ -75,6 +79,8 @@ def algoritmo_disponible(nombre):
     Retorna:
         True si está disponible, False si hubo error al importar.
     """
+    if nombre in _ALGORITMOS and _ALGORITMOS[nombre][1] not in globals():
+        _cargar(nombre)
     return nombre not in ERRORES_CARGA
 
 
@@ -85,10 +91,14 @@ def obtener_error(nombre):
     return ERRORES_CARGA.get(nombre, None)
 
 
-# Imprimir resumen al cargar (útil para depuración en consola)
-if ERRORES_CARGA:
-    print("⚠ Algoritmos con errores de carga:")
-    for nombre, error in ERRORES_CARGA.items():
-        print(f"  ✗ {nombre}: {error.splitlines()[-1]}")
-else:
-    print("✓ Todos los algoritmos cargados correctamente")
+# Imprimir resumen al cargar (útil para depuración en consola).
+# Obliga a importar todos los algoritmos, por eso solo con DEBUG.
+if os.environ.get('DEBUG'):
+    for _clave in _ALGORITMOS:
+        algoritmo_disponible(_clave)
+    if ERRORES_CARGA:
+        print("⚠ Algoritmos con errores de carga:")
+        for nombre, error in ERRORES_CARGA.items():
+            print(f"  ✗ {nombre}: {error.splitlines()[-1]}")
+    else:
+        print("✓ Todos los algoritmos cargados correctamente")
@@ -0,0 +1,327 @@
+# =====================================================================
+# algorithms/_kernels.py — Núcleos compilados (Numba)
+# =====================================================================
+# Versiones "solo resultado" de Dijkstra, A* y Bellman-Ford, sin
+# snapshots, pensadas
+# para compilarse con Numba (@njit), más los ciclos enteros de Kruskal
+# (union-find) y Prim (búsqueda del mínimo), cuyos pasos se arman luego
+# en Python. Trabajan directamente sobre la CSR
+# del grafo (indptr, indices, weights); Dijkstra y A* usan un min-heap
+# binario propio guardado en dos arreglos paralelos (prioridades y
+# nodos), sin tuplas ni objetos de Python dentro del ciclo principal.
+#
+# Cada núcleo tiene una firma fija (índices int32, pesos y heurística
+# float64, arreglos contiguos) y se compila la PRIMERA VEZ que se llama
+# (ver _NucleoPerezoso), no al importar el módulo: importar _kernels no
+# carga Numba, y ejecutar Kruskal no compila los núcleos de búsqueda.
+# Cada núcleo genera una sola especialización (guardada en caché en
+# disco) en lugar de despachar por tipos en cada llamada.
+#
+# Con grafos chicos (menos de UMBRAL_NUCLEO nodos) cargar Numba y el
+# núcleo cuesta más de lo que ahorra, así que los algoritmos usan su
+# versión de Python/NumPy; ver usar_nucleo().
+#
+# Numba es OPCIONAL: si no está instalado, el mismo código se ejecuta
+# como Python normal (más lento, pero con el mismo resultado).
+# =====================================================================
+
+import functools
+from importlib.util import find_spec
+
+import numpy as np
+
+# Solo se comprueba que Numba esté instalado; se importa al compilar
+NUMBA_DISPONIBLE = find_spec('numba') is not None
+
+# Nodos a partir de los cuales conviene el núcleo compilado
+UMBRAL_NUCLEO = 50
+
+
+def usar_nucleo(n):
+    """True si hay Numba y el grafo (n nodos) justifica el núcleo compilado."""
+    return NUMBA_DISPONIBLE and n >= UMBRAL_NUCLEO
+
+
+class _NucleoPerezoso:
+    """
+    Envoltorio de un núcleo que se compila con su firma en la primera
+    llamada (y se reutiliza en las siguientes). Sin Numba, llama a la
+    función de Python tal cual.
+    """
+
+    def __init__(self, firma, funcion):
+        functools.update_wrapper(self, funcion)
+        self.py_func = funcion
+        self._firma = firma
+        self._compilado = None
+
+    def __call__(self, *args):
+        if self._compilado is None:
+            if NUMBA_DISPONIBLE:
+                from numba import njit
+                self._compilado = njit(self._firma, cache=True)(self.py_func)
+            else:
+                self._compilado = self.py_func
+        return self._compilado(*args)
+
+
+def _compilar_al_usar(firma):
+    """Decorador: convierte la función en un _NucleoPerezoso con esa firma."""
+    return lambda funcion: _NucleoPerezoso(firma, funcion)
+
+
+# Firma de los núcleos: (indptr, indices, weights, h, inicio, objetivo)
+# → (costo float64, padre int32)
+_FIRMA = (
+    "Tuple((float64[::1], int32[::1]))"
+    "(int32[::1], int32[::1], float64[::1], float64[::1], int64, int64)"
+)
+
+# Firma de Bellman-Ford: (indptr, indices, weights, origen) → (dist, padre)
+_FIRMA_BF = (
+    "Tuple((float64[::1], int32[::1]))"
+    "(int32[::1], int32[::1], float64[::1], int64)"
+)
+
+# Firma de Kruskal: (origenes, destinos ya ordenados por peso, N) → aceptadas
+_FIRMA_KRUSKAL = "boolean[::1](int32[::1], int32[::1], int64)"
+
+# Firma de Prim: (indptr, indices, weights) → (orden de inclusión, padre al incluir)
+_FIRMA_PRIM = "Tuple((int32[::1], int32[::1]))(int32[::1], int32[::1], float64[::1])"
+
+
+@_compilar_al_usar(_FIRMA)
+def busqueda_core(indptr, indices, weights, h, inicio, objetivo):
+    """
+    Búsqueda de costo mínimo sobre una CSR con prioridad g(v) + h[v].
+    Con h = 0 es Dijkstra; con una heurística es A*. Sigue las mismas
+    reglas que dijkstra_pasos / a_star_pasos (desempates por nodo, poda
+    contra la mejor ruta conocida al objetivo).
+
+    Parámetros:
+        indptr, indices: CSR del grafo (int32).
+        weights:         Pesos de cada arista de la CSR (float64).
+        h:               Heurística de cada nodo hacia el objetivo (float64).
+        inicio:          Índice del nodo origen.
+        objetivo:        Índice del nodo destino (se detiene al extraerlo).
+
+    Retorna:
+        (costo, padre): costo real g de cada nodo en float64 (inf si no
+        se alcanzó) y padre en int32 con -1 para "sin padre".
+    """
+    n = indptr.shape[0] - 1
+    costo = np.full(n, np.inf)
+    padre = np.full(n, -1, dtype=np.int32)
+    visitado = np.zeros(n, dtype=np.bool_)
+
+    # Cada arista dirigida relaja a lo sumo una vez → E + 1 entradas máximo
+    cap = indices.shape[0] + 1
+    heap_f = np.empty(cap, dtype=np.float64)
+    heap_v = np.empty(cap, dtype=np.int32)
+
+    costo[inicio] = 0.0
+    heap_f[0] = h[inicio]
+    heap_v[0] = inicio
+    tam = 1
+
+    while tam > 0:
+        # ---- Extraer el mínimo (raíz) ----
+        u = heap_v[0]
+        tam -= 1
+        if tam > 0:
+            # Mover el último elemento a la raíz y hundirlo (sift-down)
+            hf = heap_f[tam]
+            hv = heap_v[tam]
+            i = 0
+            while True:
+                k = 2 * i + 1
+                if k >= tam:
+                    break
+                # (f, v) se comparan igual que las tuplas de heapq
+                if k + 1 < tam and (heap_f[k + 1] < heap_f[k] or (
+                        heap_f[k + 1] == heap_f[k] and heap_v[k + 1] < heap_v[k])):
+                    k += 1
+                if not (heap_f[k] < hf or (heap_f[k] == hf and heap_v[k] < hv)):
+                    break
+                heap_f[i] = heap_f[k]
+                heap_v[i] = heap_v[k]
+                i = k
+            heap_f[i] = hf
+            heap_v[i] = hv
+
+        # Entradas duplicadas (desactualizadas) se ignoran
+        if visitado[u]:
+            continue
+        visitado[u] = True
+
+        if u == objetivo:
+            break
+
+        # ---- Relajar aristas de u ----
+        for e in range(indptr[u], indptr[u + 1]):
+            w = weights[e]
+            if w > 0:
+                v = indices[e]
+                nuevo = costo[u] + w
+                # Poda contra la mejor ruta conocida al objetivo
+                if nuevo + h[v] >= costo[objetivo]:
+                    continue
+                if nuevo < costo[v]:
+                    costo[v] = nuevo
+                    padre[v] = u
+                    if visitado[v]:
+                        continue
+                    # Insertar (nuevo + h[v], v) y subirlo (sift-up)
+                    f = nuevo + h[v]
+                    i = tam
+                    tam += 1
+                    while i > 0:
+                        p = (i - 1) // 2
+                        if not (f < heap_f[p] or (f == heap_f[p] and v < heap_v[p])):
+                            break
+                        heap_f[i] = heap_f[p]
+                        heap_v[i] = heap_v[p]
+                        i = p
+                    heap_f[i] = f
+                    heap_v[i] = v
+
+    return costo, padre
+
+
+def dijkstra_core(indptr, indices, weights, inicio, objetivo):
+    """
+    Dijkstra sobre una CSR: busqueda_core sin heurística.
+    Retorna (dist, padre) con el mismo formato que busqueda_core.
+    """
+    h = np.zeros(indptr.shape[0] - 1)
+    return busqueda_core(indptr, indices, weights, h, inicio, objetivo)
+
+
+def a_star_core(indptr, indices, weights, h, inicio, objetivo):
+    """
+    A* sobre una CSR con la heurística h[v] ya calculada para cada nodo.
+    Retorna (g, padre) con el mismo formato que busqueda_core.
+    """
+    return busqueda_core(indptr, indices, weights, h, inicio, objetivo)
+
+
+@_compilar_al_usar(_FIRMA_BF)
+def bellman_ford_core(indptr, indices, weights, origen):
+    """
+    Bellman-Ford sobre una CSR: hasta N-1 pasadas relajando cada arista
+    dirigida en el orden de la CSR (el mismo de ga.aristas()), con la
+    misma regla que bellman_ford_pasos y corte temprano si una pasada
+    completa no cambia nada.
+
+    Retorna:
+        (dist, padre): distancias en float64 (inf si no se alcanzó) y
+        padre en int32 con -1 para "sin padre".
+    """
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+    padre = np.full(n, -1, dtype=np.int32)
+    dist[origen] = 0.0
+
+    for _ in range(n - 1):
+        cambio = False
+        for u in range(n):
+            dist_u = dist[u]
+            if dist_u == np.inf:
+                continue
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                if dist_u + weights[e] < dist[v]:
+                    dist[v] = dist_u + weights[e]
+                    padre[v] = u
+                    cambio = True
+                    # Un lazo (v == u) con peso negativo baja dist[u] en su propia fila
+                    dist_u = dist[u]
+        if not cambio:
+            break
+
+    return dist, padre
+
+
+@_compilar_al_usar(_FIRMA_KRUSKAL)
+def kruskal_core(origenes, destinos, n):
+    """
+    Union-find de Kruskal (compresión de camino + unión por rango) sobre
+    aristas ya ordenadas por peso.
+
+    Retorna:
+        Arreglo bool con True en las aristas aceptadas (no forman ciclo).
+    """
+    padre_uf = np.arange(n)
+    rango_uf = np.zeros(n, dtype=np.int32)
+    aceptadas = np.zeros(origenes.shape[0], dtype=np.bool_)
+
+    for i in range(origenes.shape[0]):
+        # Raíces de u y v, apuntando cada nodo del camino a la raíz
+        ru = origenes[i]
+        while padre_uf[ru] != ru:
+            ru = padre_uf[ru]
+        x = origenes[i]
+        while padre_uf[x] != ru:
+            padre_uf[x], x = ru, padre_uf[x]
+        rv = destinos[i]
+        while padre_uf[rv] != rv:
+            rv = padre_uf[rv]
+        x = destinos[i]
+        while padre_uf[x] != rv:
+            padre_uf[x], x = rv, padre_uf[x]
+
+        if ru != rv:
+            # El árbol de menor rango cuelga del mayor
+            if rango_uf[ru] < rango_uf[rv]:
+                ru, rv = rv, ru
+            padre_uf[rv] = ru
+            if rango_uf[ru] == rango_uf[rv]:
+                rango_uf[ru] += 1
+            aceptadas[i] = True
+
+    return aceptadas
+
+
+@_compilar_al_usar(_FIRMA_PRIM)
+def prim_core(indptr, indices, weights):
+    """
+    Prim sobre una CSR desde el nodo 0 con las mismas reglas que
+    prim_pasos: mínimo de min_w fuera del árbol (empates: menor índice),
+    corte si el resto no es alcanzable y mejora de los vecinos de la CSR.
+
+    Retorna:
+        (orden, padre): nodos en el orden en que entran al árbol y, para
+        cada nodo, su padre al entrar (-1 para la raíz o sin alcanzar).
+    """
+    n = indptr.shape[0] - 1
+    min_w = np.full(n, np.inf)
+    en_mst = np.zeros(n, dtype=np.bool_)
+    padre = np.full(n, -1, dtype=np.int32)
+    orden = np.empty(n, dtype=np.int32)
+    k = 0
+
+    if n:
+        min_w[0] = 0.0
+
+    for _ in range(n):
+        # Búsqueda lineal del mínimo fuera del árbol
+        u = -1
+        mejor = np.inf
+        for v in range(n):
+            if not en_mst[v] and min_w[v] < mejor:
+                mejor = min_w[v]
+                u = v
+        if u == -1:
+            break                            # El resto no es alcanzable desde el nodo 0
+        en_mst[u] = True
+        orden[k] = u
+        k += 1
+
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            w = weights[e]
+            if w < min_w[v] and not en_mst[v]:
+                min_w[v] = w
+                padre[v] = u
+
+    return orden[:k].copy(), padre
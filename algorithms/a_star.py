@@ -6,86 +6,141 @@
 # es f(n) = g(n) + h(n), donde g(n) es el costo real acumulado.
 #
 # La heurística usada aquí es la distancia euclidiana entre posiciones
-# ficticias en una cuadrícula (generadas por generar_coords).
+# ficticias en una cuadrícula (generadas por generar_coords). También
+# se puede elegir la distancia Manhattan, que evita la raíz cuadrada.
 #
 # Complejidad: depende de la heurística; en el mejor caso O(V log V).
 # =====================================================================
 
-import heapq
-from grafo import generar_coords
+import numpy as np
+from algorithms._kernels import a_star_core, usar_nucleo
+from algorithms.heap_indexado import HeapIndexado
 
 
-def a_star_pasos(ga, inicio, objetivo):
+HEURISTICAS = ('euclidiana', 'manhattan')
+
+
+def a_star_pasos(ga, inicio, objetivo, heuristica='euclidiana', animacion=True):
     """
     Ejecuta A* paso a paso.
 
     Parámetros:
-        ga:       Instancia de GrafoActivo.
-        inicio:   Índice del nodo origen.
-        objetivo: Índice del nodo destino.
+        ga:         Instancia de GrafoActivo.
+        inicio:     Índice del nodo origen.
+        objetivo:   Índice del nodo destino.
+        heuristica: 'euclidiana' (por defecto) o 'manhattan'.
+                    Manhattan es más barata (sin raíz cuadrada) y en una
+                    cuadrícula suele expandir menos nodos, pero es más
+                    agresiva: puede sobreestimar el costo restante y
+                    entonces el camino encontrado no es siempre el óptimo.
+        animacion:  Si es False no se devuelven pasos y, con Numba y un
+                    grafo grande, el resultado sale del núcleo compilado
+                    (ver _kernels.py).
 
     Retorna:
         (pasos, camino, g) donde:
-          - pasos:  snapshots de cada iteración
+          - pasos:  cambios de estado de cada iteración ('actual',
+                    'padre_delta', 'g_delta'; ver algorithms/pasos.py).
+                    Vacía si animacion=False
           - camino: lista de índices del camino encontrado
           - g:      diccionario {nodo: costo_real} al finalizar
     """
-    import math
+    if heuristica not in HEURISTICAS:
+        raise ValueError(
+            f"Heurística desconocida: {heuristica!r} (opciones: {', '.join(HEURISTICAS)})"
+        )
 
-    # Generar coordenadas ficticias para la heurística
-    coords = generar_coords(ga.N)
+    # Heurística entre coordenadas ficticias en cuadrícula: la matriz de
+    # todos los pares se calcula una vez por grafo (ga.heuristica) y, con
+    # el objetivo fijo, h(v) es su fila H[objetivo] (contigua y simétrica)
+    h_arr = ga.heuristica(heuristica)[objetivo]
 
-    def h(a, b):
-        """Heurística: distancia euclidiana entre nodos a y b."""
-        return math.hypot(
-            coords[b][0] - coords[a][0],
-            coords[b][1] - coords[a][1]
-        )
+    if not animacion:
+        return _a_star_resultado(ga, inicio, objetivo, heuristica, h_arr)
+
+    # Lista para el ciclo de Python (indexarla es más rápido que el arreglo)
+    h = h_arr.tolist()
 
-    # Cola de prioridad con f(n) = g(n) + h(n)
-    pq = [(h(inicio, objetivo), inicio)]
+    # Cola de prioridad indexada con f(n) = g(n) + h(n)
+    pq = HeapIndexado(ga.N)
+    pq.insertar_o_disminuir(inicio, h[inicio])
     g = {inicio: 0}            # Costo real acumulado desde el origen
-    padre = {inicio: None}     # Árbol de búsqueda
+    padre = [-1] * ga.N        # Árbol de búsqueda (-1 = sin padre)
+    cambios_padre = [(inicio, None)]   # Cambios desde el último paso
+    cambios_g = [(inicio, 0)]
     pasos = []
-    visitado = set()
+    visitado = [False] * ga.N
+    mejor_al_objetivo = float('inf')   # g del objetivo cuando ya se alcanzó
 
     while pq:
-        _, u = heapq.heappop(pq)  # Extraer nodo con menor f(n)
-
-        if u in visitado:
-            continue
+        _, u = pq.extraer_min()   # Extraer nodo con menor f(n)
+        visitado[u] = True
 
-        visitado.add(u)
-
-        # Snapshot del estado
+        # Registrar los cambios desde el paso anterior
         pasos.append({
             'actual': u,
-            'visitados': set(visitado),
-            'g': dict(g),
-            'padre': dict(padre)
+            'padre_delta': cambios_padre,
+            'g_delta': cambios_g
         })
+        cambios_padre, cambios_g = [], []
 
         # Si alcanzamos el objetivo, terminamos
         if u == objetivo:
             break
 
-        # Expandir vecinos
-        for v in range(ga.N):
-            if ga.matriz[u][v] > 0:
-                nuevo = g[u] + ga.matriz[u][v]
+        # Expandir vecinos (solo los reales, vía CSR)
+        vecinos, pesos = ga.vecinos(u)
+        for v, w in zip(vecinos.tolist(), pesos.tolist()):
+            if w > 0:
+                nuevo = g[u] + w
+                # Poda: f(v) no puede bajar de la mejor ruta ya encontrada
+                # al objetivo (para v == objetivo es la comparación normal)
+                if nuevo + h[v] >= mejor_al_objetivo:
+                    continue
                 # Solo actualizar si encontramos un camino mejor
                 if v not in g or nuevo < g[v]:
                     g[v] = nuevo
+                    if v == objetivo:
+                        mejor_al_objetivo = nuevo
                     padre[v] = u
+                    cambios_g.append((v, nuevo))
+                    cambios_padre.append((v, u))
                     # Prioridad = costo real + estimación al destino
-                    heapq.heappush(pq, (nuevo + h(v, objetivo), v))
+                    # (decrease-key si v ya estaba en la cola)
+                    if not visitado[v]:
+                        pq.insertar_o_disminuir(v, nuevo + h[v])
 
     # Reconstruir camino
     camino = []
-    n = objetivo
-    while n is not None and n in padre:
-        camino.append(n)
-        n = padre[n]
-    camino.reverse()
+    if objetivo in g:
+        n = objetivo
+        while n != -1:
+            camino.append(n)
+            n = padre[n]
+        camino.reverse()
 
     return pasos, camino, g
+
+
+def _a_star_resultado(ga, inicio, objetivo, heuristica, h_arr):
+    """Ejecuta solo el núcleo compilado y reconstruye el camino."""
+    if not usar_nucleo(ga.N):
+        # Grafo chico o sin Numba: la versión paso a paso, sin sus pasos
+        _, camino, g = a_star_pasos(ga, inicio, objetivo, heuristica)
+        return [], camino, g
+
+    costo, padre = a_star_core(
+        ga.indptr, ga.indices, ga.weights.astype(np.float64), h_arr, inicio, objetivo
+    )
+
+    camino = []
+    if np.isfinite(costo[objetivo]):
+        n = objetivo
+        while n != -1:
+            camino.append(n)
+            n = int(padre[n])
+        camino.reverse()
+
+    alcanzados = np.flatnonzero(np.isfinite(costo))
+    g = dict(zip(alcanzados.tolist(), costo[alcanzados].tolist()))
+    return [], camino, g
@@ -8,30 +8,47 @@
 # Complejidad: O(V * E)
 # =====================================================================
 
-from grafo import matriz_a_aristas
+import numpy as np
+from algorithms._kernels import bellman_ford_core, usar_nucleo
 
+# Infinito compartido: evita crear un float('inf') nuevo en cada
+# comparación del ciclo interno (se evalúa (N-1) × E veces)
+INF = float('inf')
 
-def bellman_ford_pasos(ga, origen, objetivo):
+
+def bellman_ford_pasos(ga, origen, objetivo, detallado=True):
     """
     Ejecuta Bellman-Ford paso a paso, registrando cada relajación.
 
     Parámetros:
-        ga:       Instancia de GrafoActivo.
-        origen:   Índice del nodo origen.
-        objetivo: Índice del nodo destino.
+        ga:        Instancia de GrafoActivo.
+        origen:    Índice del nodo origen.
+        objetivo:  Índice del nodo destino.
+        detallado: Si es False no se registran pasos y se usa el núcleo
+                   compilado (ver _kernels.py) o, sin Numba o con un grafo
+                   chico, relajaciones vectorizadas con NumPy (uso sin
+                   interfaz).
 
     Retorna:
         (pasos, camino, dist) donde:
-          - pasos:  lista detallada de cada relajación o convergencia
+          - pasos:  lista detallada de cada relajación o convergencia.
+                    En lugar de copiar dist/padre, cada paso trae
+                    'dist_delta' y 'padre_delta' (ver algorithms/pasos.py).
+                    Vacía si detallado=False
           - camino: ruta más corta como lista de índices
-          - dist:   lista de distancias finales
+          - dist:   np.ndarray (float64) con las distancias finales
     """
-    # Obtener todas las aristas como (u, v, peso)
-    grafo = matriz_a_aristas(ga.matriz)
+    if not detallado:
+        return _bellman_ford_resultado(ga, origen, objetivo)
+
+    # Obtener todas las aristas como (u, v, peso) (memoizadas en ga)
+    grafo = ga.aristas()
 
-    dist = [float('inf')] * ga.N     # Distancias tentativas
+    dist = [INF] * ga.N               # Distancias tentativas
     dist[origen] = 0                  # Origen tiene distancia 0
-    padre = {origen: None}            # Para reconstruir el camino
+    padre = [-1] * ga.N               # Para reconstruir el camino (-1 = sin padre)
+    cambios_padre = [(origen, None)]  # Cambios aún no registrados en un paso
+    cambios_dist = [(origen, 0)]
     pasos = []
 
     # Repetir N-1 veces (máximo de relajaciones necesarias)
@@ -40,19 +57,22 @@ def bellman_ford_pasos(ga, origen, objetivo):
 
         # Intentar relajar CADA arista del grafo
         for u, v, peso in grafo:
+            dist_u = dist[u]
             dist_anterior = dist[v]
 
             # ¿Podemos mejorar la distancia a v pasando por u?
-            if dist[u] != float('inf') and dist[u] + peso < dist[v]:
-                dist[v] = dist[u] + peso
+            if dist_u != INF and dist_u + peso < dist_anterior:
+                dist[v] = dist_u + peso
                 padre[v] = u
                 cambio_en_iteracion = True
+                cambios_dist.append((v, dist[v]))
+                cambios_padre.append((v, u))
 
                 # Registrar esta relajación exitosa con todos los detalles
                 pasos.append({
                     'iter': i + 1,                # Número de iteración
-                    'dist': dist[:],               # Distancias actuales
-                    'padre': dict(padre),          # Árbol de padres
+                    'dist_delta': cambios_dist,    # Distancias modificadas
+                    'padre_delta': cambios_padre,  # Padres modificados
                     'cambio': True,
                     'arista_evaluada': (u, v),     # Arista que se relajó
                     'peso': peso,                  # Peso de la arista
@@ -60,13 +80,14 @@ def bellman_ford_pasos(ga, origen, objetivo):
                     'dist_nueva': dist[v],          # Distancia DESPUÉS de relajar
                     'tipo': 'relajacion'
                 })
+                cambios_padre, cambios_dist = [], []
 
         # Si ninguna arista mejoró, el algoritmo convergió temprano
         if not cambio_en_iteracion:
             pasos.append({
                 'iter': i + 1,
-                'dist': dist[:],
-                'padre': dict(padre),
+                'dist_delta': cambios_dist,
+                'padre_delta': cambios_padre,
                 'cambio': False,
                 'tipo': 'sin_cambios'
             })
@@ -74,10 +95,80 @@ def bellman_ford_pasos(ga, origen, objetivo):
 
     # Reconstruir el camino más corto
     camino = []
-    n = objetivo
-    while n is not None and n in padre:
-        camino.append(n)
-        n = padre[n]
-    camino.reverse()
+    if dist[objetivo] != INF:
+        n = objetivo
+        # Tope de N nodos: con un ciclo negativo los padres pueden ciclar
+        while n != -1 and len(camino) < ga.N:
+            camino.append(n)
+            n = padre[n]
+        camino.reverse()
+
+    # El ciclo trabaja con una lista (indexar escalares de NumPy desde
+    # Python es más lento); el resultado se entrega como arreglo
+    return pasos, camino, np.array(dist, dtype=np.float64)
+
+
+def _bellman_ford_resultado(ga, origen, objetivo):
+    """
+    Ejecuta solo el núcleo compilado y reconstruye el camino. Sin Numba,
+    el núcleo correría como Python puro (un ciclo por arista), así que en
+    ese caso, o si el grafo no llega a UMBRAL_NUCLEO nodos, se usa la
+    versión vectorizada.
+    """
+    if not usar_nucleo(ga.N):
+        return _bellman_ford_vectorizado(ga.N, ga.aristas(), origen, objetivo)
+
+    dist, padre = bellman_ford_core(
+        ga.indptr, ga.indices, ga.weights.astype(np.float64), origen
+    )
+
+    camino = []
+    if np.isfinite(dist[objetivo]):
+        n = objetivo
+        # Tope de N nodos: con un ciclo negativo los padres pueden ciclar
+        while n != -1 and len(camino) < ga.N:
+            camino.append(n)
+            n = int(padre[n])
+        camino.reverse()
+
+    return [], camino, dist
+
+
+def _bellman_ford_vectorizado(n, grafo, origen, objetivo):
+    """
+    Versión sin snapshots de Bellman-Ford: cada iteración relaja TODAS
+    las aristas a la vez con operaciones de NumPy en lugar de un ciclo
+    de Python por arista.
+    """
+    aristas = np.array(grafo, dtype=np.float64).reshape(-1, 3)
+    u_arr = aristas[:, 0].astype(np.int32)
+    v_arr = aristas[:, 1].astype(np.int32)
+    w_arr = aristas[:, 2]
+
+    dist = np.full(n, np.inf)
+    dist[origen] = 0
+
+    for _ in range(n - 1):
+        # Candidatos dist[u] + peso para cada arista; el mínimo por
+        # destino se acumula con minimum.at (maneja destinos repetidos)
+        nueva = dist.copy()
+        np.minimum.at(nueva, v_arr, dist[u_arr] + w_arr)
+        if np.array_equal(nueva, dist):
+            break                          # Convergencia temprana
+        dist = nueva
+
+    # Reconstruir padres: u es padre de v si la arista u→v es "ajustada"
+    # (dist[u] + peso == dist[v]). Con varias opciones, queda cualquiera.
+    padre = np.full(n, -1, dtype=np.int32)
+    ajustada = np.isfinite(dist[u_arr]) & (dist[u_arr] + w_arr == dist[v_arr]) & (v_arr != origen)
+    padre[v_arr[ajustada]] = u_arr[ajustada]
+
+    camino = []
+    if objetivo == origen or padre[objetivo] != -1:
+        n_act = int(objetivo)
+        while n_act != -1 and len(camino) < n:
+            camino.append(n_act)
+            n_act = int(padre[n_act])
+        camino.reverse()
 
-    return pasos, camino, dist
+    return [], camino, dist
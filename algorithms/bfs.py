@@ -20,34 +20,42 @@ def bfs_pasos(ga, inicio):
         inicio: Índice del nodo donde comienza la búsqueda.
 
     Retorna:
-        Lista de diccionarios, cada uno representando un paso:
-          - 'actual':    índice del nodo que se está visitando
-          - 'visitados': conjunto de nodos ya visitados hasta este paso
-          - 'padre':     diccionario {nodo: nodo_padre} para reconstruir
-                         el árbol de recorrido
+        Lista de diccionarios, cada uno representando un paso. Solo se
+        guarda lo que cambió (ver algorithms/pasos.py):
+          - 'actual':      índice del nodo que se está visitando
+                           (los visitados son la acumulación de 'actual')
+          - 'padre_delta': lista de (nodo, nodo_padre) asignados desde el
+                           paso anterior, para reconstruir el árbol
     """
-    visitado = set()
+    # Estado interno en listas indexadas por nodo: acceso O(1) sin
+    # hashing. Los pasos solo guardan los cambios.
+    visitado = [False] * ga.N
     cola = deque([inicio])           # Cola FIFO con nodos por explorar
-    padre = {inicio: None}           # Árbol de recorrido (raíz no tiene padre)
+    en_cola = [False] * ga.N         # Ya encolado alguna vez (cada nodo entra una sola vez)
+    en_cola[inicio] = True
+    cambios_padre = [(inicio, None)] # Asignaciones a padre desde el último paso
     pasos = []
 
     while cola:
         u = cola.popleft()           # Sacar el primero de la cola
 
-        if u not in visitado:
-            visitado.add(u)
-            # Guardar una foto del estado actual
+        # Con en_cola no hay duplicados; la verificación queda por seguridad
+        if not visitado[u]:
+            visitado[u] = True
+            # Guardar solo los cambios desde el paso anterior
             pasos.append({
                 'actual': u,
-                'visitados': set(visitado),
-                'padre': dict(padre)
+                'padre_delta': cambios_padre
             })
-
-            # Explorar vecinos: si tienen arista (peso > 0) y no fueron visitados
-            for v in range(ga.N):
-                if ga.matriz[u][v] > 0 and v not in visitado:
-                    if v not in padre:
-                        padre[v] = u     # Registrar cómo llegamos a v
+            cambios_padre = []
+
+            # Explorar vecinos: si tienen arista (peso > 0) y nunca se encolaron.
+            # Solo se recorren los vecinos reales (CSR), no la fila completa.
+            vecinos, pesos = ga.vecinos(u)
+            for v, w in zip(vecinos.tolist(), pesos.tolist()):
+                if w > 0 and not en_cola[v]:
+                    en_cola[v] = True
+                    cambios_padre.append((v, u))  # Registrar cómo llegamos a v
                     cola.append(v)       # Encolar para visitar después
 
     return pasos
@@ -2,7 +2,9 @@
 # algorithms/dfs.py — Búsqueda en Profundidad (Depth-First Search)
 # =====================================================================
 # Explora el grafo yendo lo más profundo posible por cada rama
-# antes de retroceder (backtracking). Usa recursión (pila implícita).
+# antes de retroceder (backtracking). Usa una pila explícita en lugar
+# de recursión, así no hay límite de profundidad (sys.getrecursionlimit)
+# ni costo de un frame de Python por cada nodo.
 #
 # Complejidad: O(V + E) donde V = nodos, E = aristas.
 # =====================================================================
@@ -10,7 +12,7 @@
 
 def dfs_pasos(ga, inicio):
     """
-    Ejecuta DFS recursivo y registra cada paso para la animación.
+    Ejecuta DFS iterativo y registra cada paso para la animación.
 
     Parámetros:
         ga:     Instancia de GrafoActivo.
@@ -18,28 +20,43 @@ def dfs_pasos(ga, inicio):
 
     Retorna:
         Lista de pasos con la misma estructura que BFS:
-          - 'actual', 'visitados', 'padre'
+          - 'actual', 'padre_delta'
     """
-    visitado = set()
-    padre = {inicio: None}
+    visitado = [False] * ga.N          # Indexado por nodo: sin hashing
+    cambios_padre = [(inicio, None)]    # Asignaciones a padre desde el último paso
     pasos = []
 
-    def _dfs(u):
-        """Función recursiva interna que realiza el recorrido."""
-        visitado.add(u)
+    def iter_vecinos(u):
+        """Iterador sobre los vecinos reales de u (peso > 0), en orden de índice."""
+        vecinos, pesos = ga.vecinos(u)
+        return iter([v for v, w in zip(vecinos.tolist(), pesos.tolist()) if w > 0])
 
-        # Capturar el estado en este momento de la exploración
+    def visitar(u):
+        """Marca u como visitado y registra los cambios de este paso."""
+        visitado[u] = True
         pasos.append({
             'actual': u,
-            'visitados': set(visitado),
-            'padre': dict(padre)
+            'padre_delta': list(cambios_padre)
         })
+        cambios_padre.clear()
 
-        # Recorrer vecinos en orden de índice
-        for v in range(ga.N):
-            if ga.matriz[u][v] > 0 and v not in visitado:
-                padre[v] = u          # Registrar arista del árbol DFS
-                _dfs(v)               # Llamada recursiva (profundizar)
+    # Cada entrada de la pila es (nodo, iterador de sus vecinos pendientes);
+    # equivale a los frames de la versión recursiva.
+    visitar(inicio)
+    pila = [(inicio, iter_vecinos(inicio))]
+
+    while pila:
+        u, vecinos = pila[-1]
+        v = next(vecinos, None)
+
+        if v is None:
+            pila.pop()                # Sin vecinos pendientes: retroceder
+            continue
+        if visitado[v]:
+            continue
+
+        cambios_padre.append((v, u))  # Registrar arista del árbol DFS
+        visitar(v)
+        pila.append((v, iter_vecinos(v)))   # Profundizar
 
-    _dfs(inicio)
     return pasos
@@ -2,73 +2,118 @@
 # algorithms/dijkstra.py — Algoritmo de Dijkstra
 # =====================================================================
 # Encuentra la ruta más corta entre un nodo origen y un destino
-# en grafos con pesos NO negativos. Usa un min-heap (cola de prioridad)
-# para siempre procesar el nodo con menor distancia acumulada.
+# en grafos con pesos NO negativos. Usa un min-heap indexado (cola de
+# prioridad con decrease-key) para siempre procesar el nodo con menor
+# distancia acumulada.
 #
 # Complejidad: O((V + E) log V) con heap binario.
 # =====================================================================
 
-import heapq
+import numpy as np
+from algorithms._kernels import dijkstra_core, usar_nucleo
+from algorithms.heap_indexado import HeapIndexado
 
 
-def dijkstra_pasos(ga, inicio, objetivo):
+def dijkstra_pasos(ga, inicio, objetivo, animacion=True):
     """
     Ejecuta Dijkstra paso a paso.
 
     Parámetros:
-        ga:       Instancia de GrafoActivo.
-        inicio:   Índice del nodo origen.
-        objetivo: Índice del nodo destino.
+        ga:        Instancia de GrafoActivo.
+        inicio:    Índice del nodo origen.
+        objetivo:  Índice del nodo destino.
+        animacion: Si es False no se devuelven pasos y, con Numba y un
+                   grafo grande, el resultado sale del núcleo compilado
+                   (ver _kernels.py).
 
     Retorna:
         (pasos, camino, dist) donde:
-          - pasos:  lista de snapshots del estado en cada iteración
+          - pasos:  lista con los cambios de estado de cada iteración
+                    ('actual', 'padre_delta', 'dist_delta'; ver
+                    algorithms/pasos.py). Vacía si animacion=False
           - camino: lista de índices del camino más corto [inicio, ..., objetivo]
-          - dist:   lista de distancias finales desde el origen a cada nodo
+          - dist:   np.ndarray (float64) con las distancias finales desde
+                    el origen a cada nodo (inf si no se alcanzó)
     """
+    if not animacion:
+        return _dijkstra_resultado(ga, inicio, objetivo)
+
     dist = [float('inf')] * ga.N     # Distancias tentativas (infinito al inicio)
-    padre = {inicio: None}           # Para reconstruir el camino
+    padre = [-1] * ga.N              # Para reconstruir el camino (-1 = sin padre)
     dist[inicio] = 0                 # Distancia al origen es 0
-    pq = [(0, inicio)]               # Min-heap: (distancia_acumulada, nodo)
+    pq = HeapIndexado(ga.N)          # Min-heap de nodos por distancia acumulada
+    pq.insertar_o_disminuir(inicio, 0)
+    cambios_padre = [(inicio, None)] # Cambios desde el último paso
+    cambios_dist = [(inicio, 0)]
     pasos = []
-    visitado = set()
+    visitado = [False] * ga.N
 
     while pq:
-        costo, u = heapq.heappop(pq)  # Extraer nodo con menor distancia
-
-        # Si ya lo procesamos, saltar (puede haber entradas duplicadas en el heap)
-        if u in visitado:
-            continue
-
-        visitado.add(u)
+        costo, u = pq.extraer_min()   # Extraer nodo con menor distancia
+        visitado[u] = True
 
-        # Guardar snapshot del estado actual
+        # Guardar los cambios de distancias/padres desde el paso anterior
         pasos.append({
             'actual': u,
-            'visitados': set(visitado),
-            'dist': dist[:],           # Copia de las distancias actuales
-            'padre': dict(padre)
+            'padre_delta': cambios_padre,
+            'dist_delta': cambios_dist
         })
+        cambios_padre, cambios_dist = [], []
 
         # Si llegamos al destino, podemos parar
         if u == objetivo:
             break
 
         # Relajar aristas: intentar mejorar la distancia a cada vecino
-        for v in range(ga.N):
-            if ga.matriz[u][v] > 0:
-                nuevo = costo + ga.matriz[u][v]
+        vecinos, pesos = ga.vecinos(u)
+        for v, w in zip(vecinos.tolist(), pesos.tolist()):
+            if w > 0:
+                nuevo = costo + w
+                # Poda: si ya no mejora la mejor distancia conocida al
+                # destino, ningún camino por v puede superarla
+                if nuevo >= dist[objetivo]:
+                    continue
                 if nuevo < dist[v]:
                     dist[v] = nuevo
                     padre[v] = u
-                    heapq.heappush(pq, (nuevo, v))  # Agregar con nueva prioridad
+                    cambios_dist.append((v, nuevo))
+                    cambios_padre.append((v, u))
+                    # Agregar a la cola, o bajar su prioridad si ya estaba
+                    # (sin duplicados: el heap nunca pasa de V elementos)
+                    if not visitado[v]:
+                        pq.insertar_o_disminuir(v, nuevo)
 
     # Reconstruir el camino desde el destino hasta el origen
     camino = []
-    n = objetivo
-    while n is not None and n in padre:
-        camino.append(n)
-        n = padre[n]
-    camino.reverse()
+    if dist[objetivo] != float('inf'):
+        n = objetivo
+        while n != -1:
+            camino.append(n)
+            n = padre[n]
+        camino.reverse()
+
+    # El ciclo trabaja con una lista (indexar escalares de NumPy desde
+    # Python es más lento); el resultado se entrega como arreglo
+    return pasos, camino, np.array(dist, dtype=np.float64)
+
+
+def _dijkstra_resultado(ga, inicio, objetivo):
+    """Ejecuta solo el núcleo compilado y reconstruye el camino."""
+    if not usar_nucleo(ga.N):
+        # Grafo chico o sin Numba: la versión paso a paso, sin sus pasos
+        _, camino, dist = dijkstra_pasos(ga, inicio, objetivo)
+        return [], camino, dist
+
+    dist, padre = dijkstra_core(
+        ga.indptr, ga.indices, ga.weights.astype(np.float64), inicio, objetivo
+    )
+
+    camino = []
+    if np.isfinite(dist[objetivo]):
+        n = objetivo
+        while n != -1:
+            camino.append(n)
+            n = int(padre[n])
+        camino.reverse()
 
-    return pasos, camino, dist
+    return [], camino, dist
@@ -0,0 +1,103 @@
+# =====================================================================
+# algorithms/heap_indexado.py — Cola de prioridad indexada (min-heap)
+# =====================================================================
+# Min-heap binario de NODOS (enteros 0..N-1) que recuerda en qué
+# posición está cada nodo. Eso permite la operación "decrease-key":
+# cuando se encuentra un camino mejor a un nodo que ya está en la
+# cola, se baja su clave en su lugar en vez de insertar un duplicado.
+#
+# Con heapq se insertan entradas repetidas y el heap crece a O(E);
+# aquí nunca hay más de V elementos, así que cada operación cuesta
+# O(log V). Lo usan Dijkstra y A*.
+#
+# Los empates de clave se rompen por número de nodo, igual que las
+# tuplas (clave, nodo) de heapq, así el orden de extracción es el mismo.
+# =====================================================================
+
+
+class HeapIndexado:
+    """
+    Cola de prioridad de nodos con decrease-key.
+
+    Parámetro:
+        n: número de nodos (los nodos válidos son 0..n-1).
+    """
+
+    def __init__(self, n):
+        self._nodos = []             # El heap: nodos ordenados por (clave, nodo)
+        self._clave = [None] * n     # Clave actual de cada nodo
+        self._pos = [-1] * n         # Posición de cada nodo en _nodos (-1 = fuera)
+
+    def __len__(self):
+        return len(self._nodos)
+
+    def __contains__(self, nodo):
+        return self._pos[nodo] != -1
+
+    def clave(self, nodo):
+        """Retorna la clave actual de un nodo que está en la cola."""
+        return self._clave[nodo]
+
+    def insertar_o_disminuir(self, nodo, clave):
+        """
+        Inserta un nodo con la clave dada o, si ya está en la cola,
+        le asigna la nueva clave (que debe ser menor que la anterior).
+        """
+        self._clave[nodo] = clave
+        i = self._pos[nodo]
+        if i == -1:
+            i = len(self._nodos)
+            self._nodos.append(nodo)
+        self._subir(i)
+
+    def extraer_min(self):
+        """Saca y retorna (clave, nodo) con la menor clave."""
+        nodos = self._nodos
+        raiz = nodos[0]
+        ultimo = nodos.pop()
+        self._pos[raiz] = -1
+        if nodos:
+            nodos[0] = ultimo
+            self._hundir(0)
+        return self._clave[raiz], raiz
+
+    # -----------------------------------------------------------------
+    # Operaciones internas del heap
+    # -----------------------------------------------------------------
+    def _menor(self, a, b):
+        """(clave[a], a) < (clave[b], b)"""
+        ka, kb = self._clave[a], self._clave[b]
+        return ka < kb or (ka == kb and a < b)
+
+    def _subir(self, i):
+        """Sube el nodo en la posición i hasta su lugar (sift-up)."""
+        nodos, pos = self._nodos, self._pos
+        nodo = nodos[i]
+        while i > 0:
+            p = (i - 1) // 2
+            if not self._menor(nodo, nodos[p]):
+                break
+            nodos[i] = nodos[p]
+            pos[nodos[i]] = i
+            i = p
+        nodos[i] = nodo
+        pos[nodo] = i
+
+    def _hundir(self, i):
+        """Baja el nodo en la posición i hasta su lugar (sift-down)."""
+        nodos, pos = self._nodos, self._pos
+        n = len(nodos)
+        nodo = nodos[i]
+        while True:
+            h = 2 * i + 1
+            if h >= n:
+                break
+            if h + 1 < n and self._menor(nodos[h + 1], nodos[h]):
+                h += 1
+            if not self._menor(nodos[h], nodo):
+                break
+            nodos[i] = nodos[h]
+            pos[nodos[i]] = i
+            i = h
+        nodos[i] = nodo
+        pos[nodo] = i
@@ -8,6 +8,9 @@
 # Complejidad: O(E log E) por el ordenamiento de aristas.
 # =====================================================================
 
+import numpy as np
+from algorithms._kernels import kruskal_core, usar_nucleo
+
 
 def kruskal_pasos(ga):
     """
@@ -23,35 +26,32 @@ def kruskal_pasos(ga):
           - 'ok':   True si se aceptó (no forma ciclo), False si se rechazó
           - 'mst':  lista de aristas aceptadas hasta ahora
     """
-    # Extraer y ordenar todas las aristas por peso (solo parte superior de la matriz)
-    aristas = sorted(
-        [
-            (i, j, ga.matriz[i][j])
-            for i in range(ga.N)
-            for j in range(i + 1, ga.N)
-            if ga.matriz[i][j] > 0
-        ],
-        key=lambda x: x[2]   # Ordenar por peso ascendente
-    )
-
-    # ---- Union-Find (Disjoint Set Union) con compresión de camino ----
-    padre_uf = list(range(ga.N))   # Cada nodo es su propio padre al inicio
+    # Extraer y ordenar todas las aristas por peso desde la CSR (solo
+    # u < v: el grafo es simétrico), todo con NumPy: la CSR está ordenada
+    # por fila y columna y el argsort estable conserva ese orden entre
+    # aristas de igual peso.
+    indptr, indices, weights = ga.ensure_csr()
+    origenes = np.repeat(np.arange(ga.N), np.diff(indptr))
+    superior = (origenes < indices) & (weights > 0)
+    filas, columnas, pesos = origenes[superior], indices[superior], weights[superior]
+    orden = np.argsort(pesos, kind='stable')           # Ordenar por peso ascendente
 
-    def find(x):
-        """Encuentra el representante del conjunto con compresión de camino."""
-        if padre_uf[x] != x:
-            padre_uf[x] = find(padre_uf[x])  # Compresión: apuntar directo a la raíz
-        return padre_uf[x]
+    # Decidir qué aristas se aceptan: con Numba y un grafo grande el
+    # union-find corre en el núcleo compilado (ver _kernels.py); si no,
+    # con listas de Python.
+    u_ord = filas[orden].astype(np.int32)
+    v_ord = columnas[orden].astype(np.int32)
+    if usar_nucleo(ga.N):
+        aceptadas = kruskal_core(u_ord, v_ord, ga.N).tolist()
+    else:
+        aceptadas = _kruskal_aceptadas(u_ord.tolist(), v_ord.tolist(), ga.N)
 
     mst = []       # Aristas del MST acumuladas
     pasos = []
 
-    for u, v, w in aristas:
-        ru, rv = find(u), find(v)     # Raíces de los conjuntos de u y v
-        aceptada = (ru != rv)          # Aceptar solo si están en conjuntos distintos
-
+    for u, v, w, aceptada in zip(u_ord.tolist(), v_ord.tolist(),
+                                 pesos[orden].tolist(), aceptadas):
         if aceptada:
-            padre_uf[ru] = rv          # Unir los dos conjuntos
             mst.append((u, v))
 
         # Registrar el paso (aceptada o rechazada)
@@ -63,3 +63,42 @@ def kruskal_pasos(ga):
         })
 
     return pasos
+
+
+def _kruskal_aceptadas(origenes, destinos, n):
+    """
+    Union-find en Python puro (sin Numba): misma regla que kruskal_core.
+
+    Retorna:
+        Lista de bool con True en las aristas aceptadas.
+    """
+    # ---- Union-Find (Disjoint Set Union) con compresión de camino ----
+    padre_uf = list(range(n))   # Cada nodo es su propio padre al inicio
+    rango_uf = [0] * n          # Cota de la altura de cada árbol (union by rank)
+
+    def find(x):
+        """Encuentra el representante del conjunto con compresión de camino."""
+        # Primera pasada: subir hasta la raíz
+        r = x
+        while padre_uf[r] != r:
+            r = padre_uf[r]
+        # Segunda pasada: apuntar cada nodo del camino directo a la raíz
+        while padre_uf[x] != r:
+            padre_uf[x], x = r, padre_uf[x]
+        return r
+
+    aceptadas = []
+    for u, v in zip(origenes, destinos):
+        ru, rv = find(u), find(v)     # Raíces de los conjuntos de u y v
+        aceptada = (ru != rv)          # Aceptar solo si están en conjuntos distintos
+
+        if aceptada:
+            # Unir los dos conjuntos: el árbol de menor rango cuelga del mayor
+            if rango_uf[ru] < rango_uf[rv]:
+                ru, rv = rv, ru
+            padre_uf[rv] = ru
+            if rango_uf[ru] == rango_uf[rv]:
+                rango_uf[ru] += 1
+        aceptadas.append(aceptada)
+
+    return aceptadas
@@ -0,0 +1,190 @@
+# =====================================================================
+# algorithms/pasos.py — Reconstrucción del estado a partir de deltas
+# =====================================================================
+# BFS, DFS, Dijkstra, A* y Bellman-Ford no copian su estado completo
+# (padres, visitados, distancias) en cada paso, porque eso cuesta O(V)
+# por paso y O(V²) en total. En su lugar cada paso guarda solo lo que
+# cambió desde el paso anterior:
+#   - 'padre_delta': lista de (nodo, nodo_padre) asignados
+#   - 'dist_delta':  lista de (nodo, distancia) asignadas (Dijkstra, B-F)
+#   - 'g_delta':     lista de (nodo, costo_g) asignados (A*)
+#   - 'actual':      nodo visitado en ese paso (los visitados son la
+#                    acumulación de todos los 'actual' anteriores)
+#
+# ReproductorPasos aplica esos deltas de forma incremental,
+# ColumnasPasos los expande una sola vez a arreglos por campo (una fila
+# por paso; lo usa la animación, que lee el estado de un frame con un
+# índice) y materializar_pasos genera la lista con el estado completo
+# en cada paso (formato anterior).
+# =====================================================================
+
+import numpy as np
+
+# Claves de los pasos que son deltas y no se copian al estado
+_CLAVES_DELTA = ('padre_delta', 'dist_delta', 'g_delta')
+
+
+class ReproductorPasos:
+    """
+    Reconstruye el estado de un algoritmo en cualquier paso aplicando
+    los deltas en orden. Avanzar un paso cuesta solo el tamaño de su
+    delta; retroceder vuelve a aplicar desde el principio.
+
+    Atributos (estado acumulado, se modifican en su lugar):
+        padre (np.ndarray): padre de cada nodo en int32 (-1 = sin padre)
+        visitados (set):  nodos visitados
+        dist (np.ndarray): distancias en float64 (inf si no se han alcanzado)
+        g (dict):         {nodo: costo_real} (solo A*)
+    """
+
+    def __init__(self, pasos, n):
+        self.pasos = pasos
+        self.n = n
+        self._reiniciar()
+
+    def _reiniciar(self):
+        """Vuelve al estado anterior al primer paso."""
+        self.padre = np.full(self.n, -1, dtype=np.int32)
+        self.visitados = set()
+        self.dist = np.full(self.n, np.inf)
+        self.g = {}
+        self._indice = -1        # Último paso aplicado
+
+    def _aplicar(self, paso):
+        """Aplica los deltas de un paso sobre el estado acumulado."""
+        for nodo, p in paso.get('padre_delta', ()):
+            self.padre[nodo] = -1 if p is None else p
+        for nodo, d in paso.get('dist_delta', ()):
+            self.dist[nodo] = d
+        for nodo, c in paso.get('g_delta', ()):
+            self.g[nodo] = c
+        if 'padre_delta' in paso and 'actual' in paso:
+            self.visitados.add(paso['actual'])
+
+    def ir_a(self, indice):
+        """
+        Retorna el estado completo en el paso 'indice' como un dict con
+        las mismas claves que el formato anterior ('padre', 'visitados',
+        'dist', 'g' según el algoritmo, más las claves propias del paso).
+
+        Los contenedores retornados son el estado interno: no deben
+        modificarse y cambian al llamar de nuevo a ir_a.
+        """
+        if indice < self._indice:
+            self._reiniciar()
+        while self._indice < indice:
+            self._indice += 1
+            self._aplicar(self.pasos[self._indice])
+
+        paso = self.pasos[indice]
+        estado = {}
+        if 'padre_delta' in paso:
+            estado['padre'] = self.padre
+            if 'actual' in paso:
+                estado['visitados'] = self.visitados
+        if 'dist_delta' in paso:
+            estado['dist'] = self.dist
+        if 'g_delta' in paso:
+            estado['g'] = self.g
+        # Las claves propias del paso (p. ej. 'dist' de un frame final) tienen prioridad
+        for clave, valor in paso.items():
+            if clave not in _CLAVES_DELTA:
+                estado[clave] = valor
+        return estado
+
+
+class ColumnasPasos:
+    """
+    Estado de todos los pasos en arreglos por campo (estructura de
+    arreglos): la fila t de cada arreglo es el estado tras aplicar el
+    paso t. Leer un frame es un índice (sin reconstruir ni armar dicts,
+    y en cualquier orden); cuesta O(T·V) de memoria, así que se crea por
+    animación a partir de los pasos con deltas.
+
+    Atributos (T = número de pasos, N = número de nodos):
+        actual (np.ndarray):   nodo 'actual' de cada paso, int32 (T,) (-1 = no trae)
+        padre (np.ndarray):    padres en cada paso, int32 (T, N) (-1 = sin padre)
+        visitado (np.ndarray): nodos visitados hasta cada paso (acumulación
+                               de los 'actual'), bool (T, N)
+        dist (np.ndarray):     distancias en cada paso, float64 (T, N) (inf si
+                               no se han alcanzado); None si no hay 'dist_delta'
+    """
+
+    def __init__(self, pasos, n):
+        t_total = len(pasos)
+        self.actual = np.full(t_total, -1, dtype=np.int32)
+        padre_delta = ([], [], [])       # (fila, nodo, valor) de cada asignación
+        dist_delta = ([], [], [])
+        hay_dist = False
+
+        # Único recorrido en Python: aplanar los deltas (fila 0 = estado inicial)
+        for t, paso in enumerate(pasos, 1):
+            if 'actual' in paso:
+                self.actual[t - 1] = paso['actual']
+            for nodo, p in paso.get('padre_delta', ()):
+                padre_delta[0].append(t)
+                padre_delta[1].append(nodo)
+                padre_delta[2].append(-1 if p is None else p)
+            if 'dist_delta' in paso:
+                hay_dist = True
+                for nodo, d in paso['dist_delta']:
+                    dist_delta[0].append(t)
+                    dist_delta[1].append(nodo)
+                    dist_delta[2].append(d)
+
+        self.padre = _rellenar(*padre_delta, -1, (t_total, n), np.int32)
+        self.dist = _rellenar(*dist_delta, np.inf, (t_total, n), np.float64) if hay_dist else None
+
+        self.visitado = np.zeros((t_total, n), dtype=bool)
+        con_actual = np.flatnonzero(self.actual >= 0)
+        self.visitado[con_actual, self.actual[con_actual]] = True
+        np.logical_or.accumulate(self.visitado, axis=0, out=self.visitado)
+
+
+def _rellenar(filas, nodos, valores, inicial, forma, dtype):
+    """
+    Tabla (T, N) donde cada celda tiene el último valor asignado a ese
+    nodo hasta esa fila (o 'inicial' si nunca se asignó). Las filas de
+    las asignaciones empiezan en 1; la fila 0 es el estado inicial y no
+    se incluye en el resultado.
+    """
+    t_total, n = forma
+    tabla = np.full((t_total + 1, n), inicial, dtype=dtype)
+    origen = np.zeros((t_total + 1, n), dtype=np.intp)   # Fila de la que viene cada valor
+    if filas:
+        filas = np.array(filas, dtype=np.intp)
+        nodos = np.array(nodos, dtype=np.intp)
+        # Con dos asignaciones al mismo nodo en un paso gana la última
+        _, ultima = np.unique((filas * n + nodos)[::-1], return_index=True)
+        ultima = len(filas) - 1 - ultima
+        tabla[filas[ultima], nodos[ultima]] = np.array(valores, dtype=dtype)[ultima]
+        origen[filas[ultima], nodos[ultima]] = filas[ultima]
+    np.maximum.accumulate(origen, axis=0, out=origen)
+    return tabla[origen, np.arange(n)][1:]
+
+
+def materializar_pasos(pasos, n):
+    """
+    Convierte una lista de pasos con deltas en la lista con el estado
+    completo copiado en cada paso (formato anterior de los algoritmos).
+    Cuesta O(V) por paso; útil para depuración o código que necesite
+    acceder a pasos arbitrarios sin ReproductorPasos.
+
+    Parámetros:
+        pasos: lista retornada por bfs_pasos, dfs_pasos, dijkstra_pasos, etc.
+        n:     número de nodos del grafo (ga.N).
+    """
+    rep = ReproductorPasos(pasos, n)
+    completos = []
+    for i in range(len(pasos)):
+        estado = rep.ir_a(i)
+        if 'padre' in estado:
+            estado['padre'] = estado['padre'].copy()
+        if 'g' in estado:
+            estado['g'] = dict(estado['g'])
+        if 'visitados' in estado:
+            estado['visitados'] = set(estado['visitados'])
+        if 'dist' in estado:
+            estado['dist'] = estado['dist'].copy()
+        completos.append(estado)
+    return completos
@@ -5,11 +5,20 @@
 # En cada paso, agrega la arista de menor peso que conecte un nodo
 # ya incluido con uno que aún no lo está.
 #
-# Complejidad: O(E log V) con heap binario.
+# Versión con arreglo de claves: min_w[v] guarda el peso de la mejor
+# arista que une v con el árbol, y el siguiente nodo se elige con un
+# solo np.argmin. Cada paso actualiza min_w solo con los vecinos reales
+# del nodo nuevo (su tramo de la CSR), sin cola de prioridad en Python.
+# Con Numba y un grafo grande, la búsqueda del mínimo y la actualización
+# de min_w corren en el núcleo compilado prim_core (ver _kernels.py);
+# aquí solo se arman los pasos a partir del orden de inclusión.
+#
+# Complejidad: O(V² + E): V búsquedas lineales del mínimo y cada arista
+# revisada una vez por extremo.
 # =====================================================================
 
-import heapq
-from grafo import matriz_a_lista_ady
+import numpy as np
+from algorithms._kernels import prim_core, usar_nucleo
 
 
 def prim_pasos(ga):
@@ -21,40 +30,62 @@ def prim_pasos(ga):
 
     Retorna:
         Lista de pasos, cada uno con:
-          - 'actual':    nodo recién agregado al MST
-          - 'visitados': lista de nodos ya incluidos en el MST
-          - 'mst':       lista de aristas (u, v) del MST parcial
+          - 'actual': nodo recién agregado al MST (los nodos del MST
+                      son la acumulación de 'actual', ver algorithms/pasos.py)
+          - 'mst':    lista de aristas (u, v) del MST parcial
     """
-    lista = matriz_a_lista_ady(ga.matriz)   # Convertir a lista de adyacencia
-    visitado = [False] * ga.N
-    heap = [(0, 0)]                          # (peso, nodo) — empezar desde nodo 0
+    if usar_nucleo(ga.N):
+        orden, padre = prim_core(ga.indptr, ga.indices, ga.weights.astype(np.float64))
+    else:
+        orden, padre = _prim_orden(ga)
+
     mst = []                                 # Aristas del MST
-    padre = [-1] * ga.N                      # padre[v] = u si la arista u-v está en MST
     pasos = []
 
-    while heap:
-        peso, u = heapq.heappop(heap)        # Extraer arista de menor peso
-
-        if visitado[u]:
-            continue                         # Ya procesado, saltar
-
-        visitado[u] = True
-
+    for u, p in zip(orden.tolist(), padre[orden].tolist()):
         # Si tiene padre (no es el nodo raíz), agregar la arista al MST
-        if padre[u] != -1:
-            mst.append((padre[u], u))
+        if p != -1:
+            mst.append((p, u))
 
         # Guardar snapshot
         pasos.append({
             'actual': u,
-            'visitados': [i for i in range(ga.N) if visitado[i]],
             'mst': list(mst)
         })
 
-        # Agregar aristas hacia vecinos no visitados al heap
-        for v, w in lista[u]:
-            if not visitado[v]:
-                padre[v] = u
-                heapq.heappush(heap, (w, v))
-
     return pasos
+
+
+def _prim_orden(ga):
+    """
+    Prim vectorizado con NumPy (sin Numba): misma regla que prim_core.
+
+    Retorna:
+        (orden, padre): nodos en el orden en que entran al árbol y el
+        padre de cada nodo al entrar (-1 para la raíz o sin alcanzar).
+    """
+    n = ga.N
+    min_w = np.full(n, np.inf)               # Peso de la mejor arista hacia el árbol
+    en_mst = np.zeros(n, dtype=bool)
+    padre = np.full(n, -1, dtype=np.int32)   # padre[v] = u si la arista u-v está en MST
+    orden = []
+
+    if n:
+        min_w[0] = 0                         # Empezar desde nodo 0
+
+    for _ in range(n):
+        # Nodo fuera del árbol con la arista más liviana (empates: menor índice)
+        candidatos = np.where(en_mst, np.inf, min_w)
+        u = int(np.argmin(candidatos))
+        if candidatos[u] == np.inf:
+            break                            # El resto no es alcanzable desde el nodo 0
+        en_mst[u] = True
+        orden.append(u)
+
+        # Mejorar la arista candidata de los vecinos de u fuera del árbol
+        vecinos, pesos = ga.vecinos(u)
+        mejora = (pesos < min_w[vecinos]) & ~en_mst[vecinos]
+        min_w[vecinos[mejora]] = pesos[mejora]
+        padre[vecinos[mejora]] = u
+
+    return np.array(orden, dtype=np.int32), padre
@@ -14,22 +14,49 @@
 
 import os
 import sys
+import time
 import tkinter as tk
+from bisect import bisect_right
+from functools import lru_cache, partial
 from tkinter import ttk, filedialog, messagebox
 
-import matplotlib.pyplot as plt
-import networkx as nx
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.animation import FuncAnimation
+import numpy as np
+
+# networkx y las clases de matplotlib se importan dentro de los métodos
+# que las usan (la primera vez quedan en sys.modules): así la ventana
+# aparece antes de pagar su costo de importación.
 
 # Módulos internos del proyecto
-from config import COLORS, GRAFOS_EJEMPLO
+from config import COLORS, GRAFOS_EJEMPLO, MAX_FPS, MPL_BACKEND, MPL_RCPARAMS
 from grafo import GrafoActivo, cargar_desde_json
-from algorithms import (
-    bfs_pasos, dfs_pasos, dijkstra_pasos, a_star_pasos,
-    bellman_ford_pasos, kruskal_pasos, prim_pasos,
-    algoritmo_disponible, obtener_error
-)
+# Los algoritmos se cargan bajo demanda (algorithms.bfs_pasos, etc.): solo
+# se importa el módulo del algoritmo que se ejecuta
+import algorithms
+from algorithms import algoritmo_disponible, obtener_error, ColumnasPasos
+
+
+# Rangos del slider de velocidad (ms): menos de 400 es "Ultra Rápida",
+# de 400 a 699 "Muy Rápida", etc.
+_SPEED_BOUNDS = (400, 700, 1000, 1400, 1800)
+_SPEED_LABELS = ("Ultra Rápida", "Muy Rápida", "Rápida", "Normal", "Lenta", "Muy Lenta")
+
+# Resultados de algoritmos guardados a la vez por _get_pasos (cada uno
+# tiene la lista completa de pasos); al pasar el tope se descarta el
+# usado hace más tiempo
+_MAX_PASOS_CACHE = 8
+
+
+# La UI usa pocos colores de botón distintos y _lighten se llama en cada
+# <Enter>: con la caché cada evento es una búsqueda en un dict.
+@lru_cache(maxsize=64)
+def _lighten_cached(hex_color, factor):
+    """Aclara un color hex en un factor dado (0.0 a 1.0)."""
+    hex_color = hex_color.lstrip('#')
+    r, g, b = int(hex_color[:2], 16), int(hex_color[2:4], 16), int(hex_color[4:], 16)
+    r = min(255, int(r + (255 - r) * factor))
+    g = min(255, int(g + (255 - g) * factor))
+    b = min(255, int(b + (255 - b) * factor))
+    return f'#{r:02x}{g:02x}{b:02x}'
 
 
 class App(tk.Tk):
@@ -57,21 +84,37 @@ class App(tk.Tk):
         # --- Estado interno ---
         self.ga = GrafoActivo()       # Grafo actualmente cargado
         self.current_anim = None      # Referencia a la animación activa
+        # Resultados de los algoritmos ya ejecutados sobre el grafo actual
+        # (ver _get_pasos), válidos mientras no cambie ga.version
+        self._pasos_cache = {}
+        self._pasos_version = None
 
         # Interceptar el cierre de ventana para limpiar recursos
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        # Construir la interfaz y cargar el grafo por defecto
+        # Construir la interfaz (solo Tkinter). El canvas de matplotlib y el
+        # grafo por defecto se crean en _startup, con la ventana ya visible
         self._build_ui()
+        self.status_var.set("Cargando…")
+        self.after_idle(self._startup)
+
+    def _startup(self):
+        """
+        Segunda fase del arranque: muestra la ventana con los controles y
+        recién entonces importa matplotlib, crea el canvas y dibuja el grafo
+        por defecto.
+        """
+        self.update()                 # Pintar la ventana antes de lo pesado
+        self._build_canvas()
         self._load_default_graph()
+        self.status_var.set("Listo")
 
     # =================================================================
     # CIERRE LIMPIO
     # =================================================================
     def _on_close(self):
-        """Detiene animaciones, cierra figuras matplotlib y termina."""
+        """Detiene animaciones y termina (la figura se destruye con la ventana)."""
         self._stop_animation()
-        plt.close('all')
         self.destroy()
         sys.exit(0)
 
@@ -93,7 +136,6 @@ class App(tk.Tk):
         self.right.pack(side='right', fill='both', expand=True)
 
         self._build_left_panel()
-        self._build_canvas()
 
     def _build_left_panel(self):
         """Construye todas las secciones del panel de controles."""
@@ -149,12 +191,13 @@ class App(tk.Tk):
         algo_frame = tk.Frame(p, bg=COLORS['bg_panel'])
         algo_frame.pack(fill='x', padx=20, pady=4)
 
-        # Crear un radiobutton por cada algoritmo
+        # Crear un radiobutton por cada algoritmo. Los módulos de los
+        # algoritmos no se importan aquí (se cargan al ejecutarlos): si uno
+        # falla, _run_algorithm marca su botón con ✗ en ese momento
+        self._algo_buttons = {}
         for text, val in algorithms:
-            # Marcar con ✗ los que no se pudieron cargar
-            label = text if algoritmo_disponible(val) else f"✗ {text} (error)"
             rb = tk.Radiobutton(
-                algo_frame, text=label, variable=self.algo_var, value=val,
+                algo_frame, text=text, variable=self.algo_var, value=val,
                 bg=COLORS['bg_panel'], fg=COLORS['text1'],
                 selectcolor=COLORS['bg_card'],
                 activebackground=COLORS['bg_panel'],
@@ -163,6 +206,7 @@ class App(tk.Tk):
                 command=self._on_algo_change
             )
             rb.pack(fill='x', pady=1)
+            self._algo_buttons[val] = (rb, text)
 
         self._sep(p)
 
@@ -219,6 +263,8 @@ class App(tk.Tk):
 
         # Slider (200ms = muy rápido, 3000ms = muy lento)
         self.speed_var = tk.IntVar(value=1200)
+        # Cambiar la velocidad durante una animación ajusta su timer en vivo
+        self.speed_var.trace_add('write', self._on_speed_change)
         speed_slider = tk.Scale(
             speed_frame,
             from_=200, to=3000,
@@ -298,7 +344,17 @@ class App(tk.Tk):
 
     def _build_canvas(self):
         """Crea la figura de matplotlib y la integra en el panel derecho."""
-        self.fig, self.ax = plt.subplots(figsize=(9, 7))
+        # Primer uso de matplotlib: fijar backend y estilo antes de la figura
+        import matplotlib
+        matplotlib.use(MPL_BACKEND)
+        matplotlib.rcParams.update(MPL_RCPARAMS)
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        # Figure directa (sin pyplot): la figura no queda registrada en el
+        # gestor global de pyplot y se destruye junto con la ventana
+        self.fig = Figure(figsize=(9, 7))
+        self.ax = self.fig.add_subplot(111)
         self.fig.patch.set_facecolor(COLORS['bg_dark'])
         self.ax.set_facecolor(COLORS['bg_card'])
         self.ax.axis('off')
@@ -307,6 +363,22 @@ class App(tk.Tk):
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.right)
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
 
+        # Caché de la vista "Ver Grafo" ya renderizada (imagen RGBA de toda
+        # la figura), válida mientras no cambien el grafo ni el tamaño
+        self._base_rgba = None
+        self._base_version = None     # ga.version con la que se capturó
+        self._capturar_base = False   # Capturar en el próximo draw_event
+        self._imagen_base = None      # figimage con la que se pegó la caché
+
+        # (ga.version, bellman) de los artistas de animación que tiene la
+        # figura, o None si no tiene (ver _draw_static_layers)
+        self._artists_key = None
+        # Buffer sin los artistas animados, guardado por _on_draw antes de
+        # dibujarlos encima; se restaura antes del siguiente frame
+        self._fondo_limpio = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
+
     # =================================================================
     # HELPERS DE WIDGETS
     # =================================================================
@@ -344,40 +416,46 @@ class App(tk.Tk):
             height=h, bd=0
         )
         # Efecto hover: aclarar el color al entrar, restaurar al salir
-        b.bind('<Enter>', lambda e, btn=b, c=color: btn.config(bg=self._lighten(c)))
-        b.bind('<Leave>', lambda e, btn=b, c=color: btn.config(bg=c))
+        b.bind('<Enter>', partial(self._on_hover_enter, b, color))
+        b.bind('<Leave>', partial(self._on_hover_leave, b, color))
         return b
 
+    def _on_hover_enter(self, btn, color, _event):
+        """Aclara el fondo del botón al pasar el mouse."""
+        btn.config(bg=self._lighten(color))
+
+    def _on_hover_leave(self, btn, color, _event):
+        """Restaura el color original del botón."""
+        btn.config(bg=color)
+
     def _lighten(self, hex_color, factor=0.15):
         """Aclara un color hex en un factor dado (0.0 a 1.0)."""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = int(hex_color[:2], 16), int(hex_color[2:4], 16), int(hex_color[4:], 16)
-        r = min(255, int(r + (255 - r) * factor))
-        g = min(255, int(g + (255 - g) * factor))
-        b = min(255, int(b + (255 - b) * factor))
-        return f'#{r:02x}{g:02x}{b:02x}'
+        return _lighten_cached(hex_color, factor)
 
     def _update_speed_label(self, value=None):
         """Actualiza el texto descriptivo de velocidad cuando se mueve el slider."""
         speed = self.speed_var.get()
-        self.speed_entry.delete(0, tk.END)
-        self.speed_entry.insert(0, str(speed))
+        # Solo tocar los widgets si cambió el valor (el slider llama a
+        # esta función en cada movimiento del mouse)
+        if self.speed_entry.get() != str(speed):
+            self.speed_entry.delete(0, tk.END)
+            self.speed_entry.insert(0, str(speed))
 
         # Categorizar la velocidad en rangos
-        if speed < 400:
-            desc = "Ultra Rápida"
-        elif speed < 700:
-            desc = "Muy Rápida"
-        elif speed < 1000:
-            desc = "Rápida"
-        elif speed < 1400:
-            desc = "Normal"
-        elif speed < 1800:
-            desc = "Lenta"
-        else:
-            desc = "Muy Lenta"
+        desc = _SPEED_LABELS[bisect_right(_SPEED_BOUNDS, speed)]
+        texto = f"{desc} ({speed} ms)"
+        if self.speed_label.cget('text') != texto:
+            self.speed_label.config(text=texto)
 
-        self.speed_label.config(text=f"{desc} ({speed} ms)")
+    def _on_speed_change(self, *_args):
+        """
+        Aplica la velocidad nueva (slider o campo manual) a la animación en
+        curso cambiando el intervalo de su timer: no se recalculan los
+        pasos ni se reinicia la animación. Rige desde el siguiente frame.
+        """
+        timer = getattr(self.current_anim, 'event_source', None)
+        if timer is not None:
+            timer.interval = self.speed_var.get()
 
     def _set_manual_speed(self, event=None):
         """Valida y aplica la velocidad ingresada manualmente."""
@@ -439,10 +517,13 @@ class App(tk.Tk):
         nombre = f"Custom ({os.path.basename(path)})"
         self.ga.cargar(m, n, nombre)
 
-        # Agregar al combobox si es nuevo
+        # Agregar al combobox si es nuevo (solo se agrega ese valor, sin
+        # regenerar la lista completa)
         if nombre not in GRAFOS_EJEMPLO:
             GRAFOS_EJEMPLO[nombre] = {"matriz": m, "nombres": n}
-            self.graph_combo['values'] = list(GRAFOS_EJEMPLO.keys())
+        valores = self.graph_combo['values']
+        if nombre not in valores:
+            self.graph_combo['values'] = (*valores, nombre)
 
         self.graph_var.set(nombre)
         self._update_node_combos()
@@ -482,6 +563,8 @@ class App(tk.Tk):
         Dibuja el grafo completo sin resaltados (estado neutral).
         Se usa para la vista "Ver Grafo" y como base antes de animar.
         """
+        import networkx as nx
+
         self.ax.clear()
         self.ax.set_facecolor(COLORS['bg_card'])
         self.ax.axis('off')
@@ -503,10 +586,9 @@ class App(tk.Tk):
             font_size=13, font_weight='bold', font_color='white', ax=self.ax
         )
         # Etiquetas de peso en las aristas
-        edge_labels = nx.get_edge_attributes(self.ga.G, 'weight')
         nx.draw_networkx_edge_labels(
             self.ga.G, self.ga.pos,
-            edge_labels=edge_labels, font_size=9, font_color=COLORS['text1'],
+            edge_labels=self.ga.edge_labels(), font_size=9, font_color=COLORS['text1'],
             bbox=dict(
                 boxstyle='round,pad=0.3',
                 facecolor=COLORS['bg_card'],
@@ -531,16 +613,66 @@ class App(tk.Tk):
     def _show_graph(self):
         """Muestra el grafo en su estado neutral (sin animación)."""
         self._stop_animation()
+        self._reset_figure()
         if not self.ga.loaded:
             return
-        self._draw_base(self.ga.nombre_grafo, f"Grafo ponderado — {self.ga.N} nodos")
-        self.canvas.draw()
+        if (self._base_version == self.ga.version and self._base_rgba is not None
+                and self._base_rgba.shape[1::-1] == self.canvas.get_width_height(physical=True)):
+            # Mismo grafo y mismo tamaño: pegar la imagen guardada en vez
+            # de volver a dibujar aristas, nodos y etiquetas
+            self._imagen_base = self.fig.figimage(self._base_rgba, origin='upper')
+        else:
+            self._draw_base(self.ga.nombre_grafo, f"Grafo ponderado — {self.ga.N} nodos")
+            self._capturar_base = True
+        # draw_idle junta este dibujo con el de _stop_animation en uno solo
+        self.canvas.draw_idle()
+
+    def _on_resize(self, event):
+        """
+        Al cambiar el tamaño del canvas la imagen guardada de la vista base
+        ya no corresponde. Si es la que está en pantalla (un bitmap de
+        tamaño fijo), se vuelve a dibujar el grafo con artistas vectoriales;
+        el draw que sigue al resize captura la imagen nueva.
+        """
+        self._base_rgba = None
+        self._base_version = None
+        if self._imagen_base is not None and self._imagen_base in self.fig.images:
+            self._reset_figure()
+            self._draw_base(self.ga.nombre_grafo, f"Grafo ponderado — {self.ga.N} nodos")
+            self._capturar_base = True
+        self._imagen_base = None
+
+    def _on_draw(self, event):
+        """
+        Se llama después de cada draw completo de la figura:
+          - Guarda la vista base recién renderizada si _show_graph lo pidió.
+          - Si hay artistas animados (un draw completo los omite), los
+            dibuja encima para que no desaparezcan hasta el próximo frame
+            (al iniciar, al redimensionar o ya terminada la animación). El
+            buffer sin ellos queda en _fondo_limpio (ver
+            _restore_clean_buffer).
+        """
+        if self.canvas.is_saving():
+            return
+        if self._capturar_base:
+            self._capturar_base = False
+            self._base_rgba = np.asarray(self.canvas.buffer_rgba()).copy()
+            self._base_version = self.ga.version
+        if self._artists_key is not None and self._node_collection.get_animated():
+            self._fondo_limpio = self.canvas.copy_from_bbox(self.fig.bbox)
+            for artista in self._dynamic_artists:
+                artista.axes.draw_artist(artista)
 
     # =================================================================
     # MOTOR DE ANIMACIÓN
     # =================================================================
     def _stop_animation(self):
-        """Detiene cualquier animación en curso y resetea la figura."""
+        """
+        Detiene cualquier animación en curso y resetea la figura.
+        Si la figura tiene los artistas de una animación del grafo actual,
+        solo los devuelve al estado neutral (se reutilizan en la próxima
+        ejecución); si no, recrea un axes vacío.
+        """
         if self.current_anim is not None:
             try:
                 self.current_anim.event_source.stop()
@@ -548,14 +680,135 @@ class App(tk.Tk):
                 pass
             self.current_anim = None
 
-        # Recrear el axes limpio para evitar artefactos
+        if self._artists_key is not None and self._artists_key[0] == self.ga.version:
+            self._reset_artists()
+        else:
+            self._reset_figure()
+        self.canvas.draw_idle()
+
+    def _reset_figure(self):
+        """Recrea la figura con un axes limpio (descarta todos los artistas)."""
         self.fig.clear()
         self.ax = self.fig.add_subplot(111)
         self.ax.set_facecolor(COLORS['bg_card'])
         self.ax.axis('off')
         self.fig.patch.set_facecolor(COLORS['bg_dark'])
+        self._artists_key = None
+        self._fondo_limpio = None
+
+    def _reset_artists(self):
+        """
+        Devuelve los artistas dinámicos al estado neutral sin recrearlos
+        y los deja como artistas normales para que se vean en un draw
+        completo.
+        """
+        self._init_blit()
+        for artista in self._dynamic_artists:
+            artista.set_animated(False)
+        self._fondo_limpio = None
+
+    def _init_blit(self):
+        """
+        init_func de FuncAnimation: deja los artistas dinámicos en estado
+        neutral (aristas superpuestas ocultas, colores y textos originales,
+        distancias en ∞) sin calcular ningún paso, y los retorna.
+        """
+        self._overlay_lc.set_visible(False)
+        self._node_collection.set_array(None)
+        for n, texto in self._node_labels.items():
+            texto.set_text(n)
+        self._subtitle.set_text('')
+        if self._dist_table is not None:
+            for j in range(self.ga.N):
+                cell = self._dist_table[(0, j)]
+                cell.get_text().set_text('∞')
+                cell.set_facecolor(COLORS['bg_input'])
+        self._last_graph_state = None
+        self._last_table_state = None
+        return self._dynamic_artists
+
+    def _start_animation(self, update, n_frames):
+        """
+        Crea la FuncAnimation de un algoritmo (una vez preparados los
+        artistas con _draw_static_layers) y pide el primer dibujo.
+
+        Los pasos ya están calculados antes de animar, pero se usa
+        FuncAnimation y no ArtistAnimation: esta última necesita un grupo
+        de artistas distinto por frame (O(frames × (V+E)) objetos), y aquí
+        cada frame reutiliza los mismos artistas cambiando sus
+        propiedades; con blit=True solo esos se redibujan.
+
+        Parámetros:
+            update:   función(frame) → artistas modificados
+            n_frames: número de frames (pasos) de la animación
+        """
+        from matplotlib.animation import FuncAnimation
+
+        self.current_anim = FuncAnimation(
+            self.fig, self._restore_clean_buffer(self._throttle(self._skip_unchanged(update), n_frames)),
+            frames=n_frames,
+            init_func=self._init_blit, interval=self.speed_var.get(),
+            repeat=False, blit=True
+        )
         self.canvas.draw_idle()
 
+    def _restore_clean_buffer(self, update):
+        """
+        Envuelve la función update para que, si el último draw completo
+        dejó los artistas animados pintados en el buffer (ver _on_draw),
+        se restaure el buffer sin ellos antes del frame: FuncAnimation
+        copia ahí el fondo de cada axes que luego reutiliza con blit.
+        """
+        def envoltura(frame):
+            if self._fondo_limpio is not None:
+                self.canvas.restore_region(self._fondo_limpio)
+                self._fondo_limpio = None
+            return update(frame)
+
+        return envoltura
+
+    def _throttle(self, update, n_frames):
+        """
+        Envuelve la función update para no calcular más de MAX_FPS frames
+        por segundo. Un frame que llega antes de tiempo no se calcula:
+        retorna los artistas del último frame dibujado, sin modificarlos,
+        y el blit vuelve a pintar el frame anterior (con una lista vacía
+        FuncAnimation redibujaría toda la figura con draw_idle). Como cada
+        frame describe el estado completo, el siguiente lo reemplaza. El
+        último frame siempre se dibuja.
+        """
+        intervalo_min = 1.0 / MAX_FPS
+        ultimo = {'t': float('-inf'), 'artistas': []}
+
+        def envoltura(frame):
+            ahora = time.perf_counter()
+            if frame != n_frames - 1 and ahora - ultimo['t'] < intervalo_min:
+                return ultimo['artistas']
+            ultimo['t'] = ahora
+            ultimo['artistas'] = update(frame)
+            return ultimo['artistas']
+
+        return envoltura
+
+    def _skip_unchanged(self, update):
+        """
+        Envuelve la función update de una animación para que no vuelva a
+        calcular un frame que ya está en pantalla. FuncAnimation dibuja el
+        frame 0 al iniciar (y al redimensionar) y luego lo pide otra vez
+        con el timer; si el grafo (ga.version) y el frame no cambiaron, se
+        retornan los mismos artistas sin recalcular el estado.
+        """
+        ultimo = {'clave': None, 'artistas': []}
+
+        def envoltura(frame):
+            clave = (self.ga.version, frame)
+            if clave != ultimo['clave']:
+                ultimo['artistas'] = update(frame)
+                ultimo['clave'] = clave
+            return ultimo['artistas']
+
+        return envoltura
+
     def _run_algorithm(self):
         """
         Punto de entrada al ejecutar un algoritmo.
@@ -574,6 +827,8 @@ class App(tk.Tk):
         # Verificar que el algoritmo se cargó correctamente
         if not algoritmo_disponible(algo):
             error_msg = obtener_error(algo)
+            rb, text = self._algo_buttons[algo]
+            rb.config(text=f"✗ {text} (error)")
             messagebox.showerror(
                 "Algoritmo no disponible",
                 f"El algoritmo '{algo}' no se pudo cargar.\n\n"
@@ -584,8 +839,8 @@ class App(tk.Tk):
         # Obtener índices de los nodos seleccionados
         origen_name = self.origin_var.get()
         dest_name = self.dest_var.get()
-        origen = self.ga.nombres.index(origen_name) if origen_name in self.ga.nombres else 0
-        destino = self.ga.nombres.index(dest_name) if dest_name in self.ga.nombres else self.ga.N - 1
+        origen = self.ga.name_to_idx.get(origen_name, 0)
+        destino = self.ga.name_to_idx.get(dest_name, self.ga.N - 1)
 
         # Despachar al animador correspondiente (con manejo de errores)
         try:
@@ -609,319 +864,489 @@ class App(tk.Tk):
     # =================================================================
     # RENDERIZADORES DE FRAME
     # =================================================================
-    def _render_frame(self, step_data, algo_name, subtitle,
-                      highlight_edges=None, path_edges=None, eval_edge=None,
-                      node_color_fn=None, label_fn=None):
+    # Cada animación se dibuja en dos fases:
+    #   1) _draw_static_layers: una vez por ejecución dibuja lo que no
+    #      cambia (fondo, aristas base, título) y crea los artistas que sí
+    #      cambian (nodos, etiquetas, subtítulo) marcados como "animated",
+    #      así quedan fuera del fondo que FuncAnimation guarda en caché.
+    #   2) _render_frame / _render_bellman_frame: en cada frame solo
+    #      modifican esos artistas y los retornan. Con blit=True,
+    #      FuncAnimation restaura el fondo, dibuja únicamente esos
+    #      artistas y hace blit, sin recomponer toda la figura.
+    def _draw_static_layers(self, algo_name, bellman=False):
         """
-        Renderiza un frame genérico de animación (usado por todos los
-        algoritmos excepto Bellman-Ford que tiene su versión especial).
+        Prepara la figura para una animación: capa fija + artistas dinámicos.
 
         Parámetros:
-            step_data:       datos del paso actual (no se usa directamente aquí)
-            algo_name:       título del algoritmo para el suptitle
-            subtitle:        subtítulo con info del paso actual
-            highlight_edges: lista de aristas (nombre_u, nombre_v) a resaltar
-            path_edges:      aristas del camino final (verde, más gruesas)
-            eval_edge:       tupla (color, [aristas]) para arista siendo evaluada
-            node_color_fn:   función(índice) → color hex para cada nodo
-            label_fn:        función(índice, nombre) → texto del label del nodo
+            algo_name: título del algoritmo para el suptitle
+            bellman:   si es True, divide la figura en grafo (arriba) y
+                       tabla de distancias (abajo) como en Bellman-Ford
         """
-        self.ax.clear()
-        self.ax.set_facecolor(COLORS['bg_card'])
-        self.ax.axis('off')
+        import networkx as nx
+        from matplotlib.transforms import ScaledTranslation
+
+        # Misma figura de la ejecución anterior (mismo grafo y mismo layout):
+        # _stop_animation ya dejó sus artistas en estado neutral, así que
+        # solo se cambia el título y se vuelven a marcar como animados
+        self._last_graph_state = None     # Estado dibujado del grafo (ver _render_frame)
+        self._last_table_state = None     # (textos, columna resaltada) de la tabla; None = neutral
+        if self._artists_key == (self.ga.version, bellman):
+            self._title.set_text(algo_name)
+            for artista in self._dynamic_artists:
+                artista.set_animated(True)
+            return
+
+        self.fig.clear()
+        self.fig.patch.set_facecolor(COLORS['bg_dark'])
 
-        # Capa 1: aristas base (todas, en gris transparente)
+        if bellman:
+            # Crear grid: 3/4 para el grafo, 1/4 para la tabla
+            gs = self.fig.add_gridspec(2, 1, height_ratios=[3, 1], hspace=0.15)
+            self.ax = self.fig.add_subplot(gs[0])
+            self.ax_table = self.fig.add_subplot(gs[1])
+            self.ax_table.set_facecolor(COLORS['bg_dark'])
+            self.ax_table.axis('off')
+            self.ax_table.text(
+                0.5, 0.05, 'Distancias desde el origen',
+                ha='center', fontsize=10, color=COLORS['text_dim'],
+                transform=self.ax_table.transAxes
+            )
+            self._init_dist_table()
+            title_y, pad = 0.96, 10
+        else:
+            self.ax = self.fig.add_subplot(111)
+            self.ax_table = None
+            self._dist_table = None
+            title_y, pad = 0.97, 14
+
+        ax = self.ax
+        ax.set_facecolor(COLORS['bg_card'])
+        ax.axis('off')
+
+        # Capa fija: aristas base (todas, en gris transparente)
         nx.draw_networkx_edges(
             self.ga.G, self.ga.pos,
-            edge_color=COLORS['edge_default'], width=1.5, alpha=0.35, ax=self.ax
+            edge_color=COLORS['edge_default'], width=1.5, alpha=0.35, ax=ax
         )
 
-        # Capa 2: aristas resaltadas (árbol de exploración)
-        if highlight_edges:
-            nx.draw_networkx_edges(
-                self.ga.G, self.ga.pos, edgelist=highlight_edges,
-                edge_color=COLORS['edge_highlight'], width=3.5, alpha=0.85, ax=self.ax
-            )
+        # Artistas dinámicos: se crean una vez y cada frame solo los modifica
+        self._init_artists(ax)
 
-        # Capa 3: aristas del camino final (verde, gruesas)
-        if path_edges:
-            nx.draw_networkx_edges(
-                self.ga.G, self.ga.pos, edgelist=path_edges,
-                edge_color=COLORS['edge_path'], width=5, alpha=0.95, ax=self.ax
-            )
+        # Títulos. El subtítulo cambia en cada frame pero queda fuera del
+        # bbox del grafo (y el blit copia solo el bbox de cada axes), así
+        # que vive en un axes transparente que cubre la franja de la figura
+        # sobre el grafo, en la misma posición que tendría
+        # ax.set_title(pad=pad). Cada frame copia solo esa franja, el axes
+        # del grafo y (en Bellman-Ford) el de la tabla, no toda la figura.
+        self._title = self.fig.suptitle(
+            algo_name, fontsize=17, fontweight='bold',
+            color=COLORS['text_bright'], y=title_y
+        )
+        tope = ax.get_position().y1
+        self._ax_textos = self.fig.add_axes([0, tope, 1, 1 - tope])
+        self._ax_textos.axis('off')
+        self._subtitle = self._ax_textos.text(
+            0.5, 1.0, '',
+            transform=ax.transAxes + ScaledTranslation(0, pad / 72, self.fig.dpi_scale_trans),
+            ha='center', va='baseline', fontsize=11,
+            color=COLORS['text_dim'], style='italic'
+        )
 
-        # Capa 4: arista siendo evaluada (discontinua)
-        if eval_edge:
-            color_e, edges_e = eval_edge
-            nx.draw_networkx_edges(
-                self.ga.G, self.ga.pos, edgelist=edges_e,
-                edge_color=color_e, width=4, alpha=0.9, style='dashed', ax=self.ax
-            )
+        # En orden de dibujo (el mismo que retorna _render_frame)
+        self._dynamic_artists = [
+            self._overlay_lc, *self._edge_labels.values(),
+            self._node_collection, *self._node_labels.values(), self._subtitle
+        ]
+        if self._dist_table is not None:
+            self._dynamic_artists.append(self._dist_table)
+        for artista in self._dynamic_artists:
+            artista.set_animated(True)
+        self._artists_key = (self.ga.version, bellman)
 
-        # Nodos con colores dinámicos según el estado del algoritmo
-        if node_color_fn:
-            colors = [node_color_fn(self.ga.nombres.index(n)) for n in self.ga.G.nodes()]
-        else:
-            colors = [COLORS['node_default']] * len(self.ga.G.nodes())
-        nx.draw_networkx_nodes(
-            self.ga.G, self.ga.pos, node_color=colors, node_size=900,
-            edgecolors='#ffffff33', linewidths=2, ax=self.ax
+    def _init_artists(self, ax):
+        """
+        Crea una sola vez los artistas que cambian durante la animación y
+        guarda sus handles: colección de nodos, textos de nodos y de pesos
+        (dicts nombre → Text y arista → Text) y una LineCollection vacía
+        para todas las aristas superpuestas (árbol resaltado, camino final
+        y arista evaluada). Cada frame solo les cambia colores, segmentos,
+        visibilidad o texto.
+        """
+        import networkx as nx
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import NoNorm, to_rgba_array
+
+        # Índice de cada nodo en el orden de la colección (el de G.nodes())
+        nodos = self.ga.nodes_list()
+        self._node_idx = np.array([self.ga.name_to_idx[n] for n in nodos], dtype=np.intp)
+        # Un color por nodo (aunque sean iguales): con un color único Agg
+        # dibuja los nodos como marcadores ajustados a la grilla de píxeles,
+        # y se correrían 1 px entre el estado neutral y los frames con clases
+        self._node_collection = nx.draw_networkx_nodes(
+            self.ga.G, self.ga.pos, nodelist=nodos, node_color=[COLORS['node_default']] * len(nodos),
+            node_size=900, edgecolors='#ffffff33', linewidths=2, ax=ax
         )
-
-        # Labels de nodos (pueden incluir distancia, etc.)
-        if label_fn:
-            labels = {n: label_fn(self.ga.nombres.index(n), n) for n in self.ga.G.nodes()}
-        else:
-            labels = {n: n for n in self.ga.G.nodes()}
-        nx.draw_networkx_labels(
-            self.ga.G, self.ga.pos, labels=labels, font_size=11,
-            font_weight='bold', font_color='white', ax=self.ax
+        # Colores por clase (ver _node_cmap): con NoNorm la clase entera es
+        # directamente el índice en el colormap. Sin arreglo (set_array(None))
+        # la colección vuelve a sus colores fijos, node_default
+        self._node_collection.set_norm(NoNorm())
+        self._node_labels = nx.draw_networkx_labels(
+            self.ga.G, self.ga.pos, font_size=11,
+            font_weight='bold', font_color='white', ax=ax
         )
-
-        # Pesos en las aristas
-        edge_labels = nx.get_edge_attributes(self.ga.G, 'weight')
-        nx.draw_networkx_edge_labels(
-            self.ga.G, self.ga.pos, edge_labels=edge_labels,
+        # (índice, nombre) de cada label, en el orden de _node_labels
+        self._label_nodes = [(self.ga.name_to_idx[n], n) for n in self._node_labels]
+        # Los pesos no cambian, pero van encima de las aristas resaltadas
+        # (que sí cambian), por eso también se redibujan en cada frame
+        self._edge_labels = nx.draw_networkx_edge_labels(
+            self.ga.G, self.ga.pos,
+            edge_labels=self.ga.edge_labels(),
             font_size=9, font_color=COLORS['text1'],
             bbox=dict(
                 boxstyle='round,pad=0.3',
                 facecolor=COLORS['bg_card'],
                 edgecolor=COLORS['border'], alpha=0.9
             ),
-            ax=self.ax
+            ax=ax
         )
 
-        # Títulos
-        self.fig.texts.clear()
-        self.fig.suptitle(
-            algo_name, fontsize=17, fontweight='bold',
-            color=COLORS['text_bright'], y=0.97
-        )
-        self.ax.set_title(
-            subtitle, fontsize=11, color=COLORS['text_dim'],
-            pad=14, style='italic'
+        # Aristas superpuestas: una sola colección, vacía e invisible hasta
+        # que un frame la use. Cada segmento tiene una clase que elige su
+        # estilo: 0 = árbol de exploración, 1 = camino final, 2 = arista
+        # evaluada (su color lo da cada frame). Las clases se dibujan en
+        # ese orden, una encima de la otra.
+        self._overlay_rgba = to_rgba_array(
+            [COLORS['edge_highlight'], COLORS['edge_path'], COLORS['orange']],
+            alpha=[0.85, 0.95, 0.9]
         )
+        self._overlay_widths = np.array([3.5, 5, 4])
+        self._overlay_styles = ('solid', 'solid', 'dashed')
+        self._overlay_lc = LineCollection([], antialiaseds=(1,), zorder=1)
+        self._overlay_lc.set_visible(False)
+        ax.add_collection(self._overlay_lc, autolim=False)
 
-    def _render_bellman_frame(self, step_data, algo_name, subtitle,
-                              highlight_edges=None, path_edges=None, eval_edge=None,
-                              node_color_fn=None, label_fn=None, distancias=None):
+    def _set_overlay(self, highlight_edges, path_edges, eval_edge):
         """
-        Renderizador especial para Bellman-Ford.
-        Divide la figura en dos secciones:
-          - Arriba: visualización del grafo (igual que _render_frame)
-          - Abajo: tabla de distancias desde el origen a cada nodo
+        Asigna a la LineCollection superpuesta las aristas (índice_u,
+        índice_v) de las tres clases, en orden de dibujo. Los segmentos
+        salen de un solo indexado de pos_array, (aristas, 2, 2), y color,
+        grosor y estilo de cada uno se toman de las tablas por clase.
         """
-        self.fig.clear()
+        edges_e = eval_edge[1] if eval_edge else []
+        grupos = (highlight_edges or [], path_edges or [], edges_e)
+        lc = self._overlay_lc
+        lc.set_visible(any(grupos))
+        if not any(grupos):
+            return
 
-        # Crear grid: 3/4 para el grafo, 1/4 para la tabla
-        gs = self.fig.add_gridspec(2, 1, height_ratios=[3, 1], hspace=0.15)
-        ax_graph = self.fig.add_subplot(gs[0])
-        ax_table = self.fig.add_subplot(gs[1])
+        from matplotlib.colors import to_rgba
 
-        ax_graph.set_facecolor(COLORS['bg_card'])
-        ax_graph.axis('off')
-        ax_table.set_facecolor(COLORS['bg_dark'])
-        ax_table.axis('off')
+        clases = np.repeat(np.arange(3), [len(g) for g in grupos])
+        rgba = self._overlay_rgba
+        if edges_e:
+            rgba = rgba.copy()
+            rgba[2, :3] = to_rgba(eval_edge[0])[:3]
+        lc.set_segments(self.ga.pos_array[np.array([e for g in grupos for e in g])])
+        lc.set_color(rgba[clases])
+        lc.set_linewidth(self._overlay_widths[clases])
+        lc.set_linestyle([self._overlay_styles[c] for c in clases.tolist()])
 
-        # ---- Dibujar grafo (misma lógica que _render_frame) ----
-        nx.draw_networkx_edges(
-            self.ga.G, self.ga.pos,
-            edge_color=COLORS['edge_default'], width=1.5, alpha=0.35, ax=ax_graph
-        )
-        if highlight_edges:
-            nx.draw_networkx_edges(
-                self.ga.G, self.ga.pos, edgelist=highlight_edges,
-                edge_color=COLORS['edge_highlight'], width=3.5, alpha=0.85, ax=ax_graph
-            )
-        if path_edges:
-            nx.draw_networkx_edges(
-                self.ga.G, self.ga.pos, edgelist=path_edges,
-                edge_color=COLORS['edge_path'], width=5, alpha=0.95, ax=ax_graph
-            )
-        if eval_edge:
-            color_e, edges_e = eval_edge
-            nx.draw_networkx_edges(
-                self.ga.G, self.ga.pos, edgelist=edges_e,
-                edge_color=color_e, width=4, alpha=0.9, style='dashed', ax=ax_graph
+    def _init_dist_table(self):
+        """
+        Crea una sola vez por ejecución la tabla de distancias de
+        Bellman-Ford en ax_table, como dos tablas de una fila en el mismo
+        lugar que una de dos filas: los nombres (fija, queda en el fondo)
+        y las distancias (animada), que empiezan en ∞ y cada frame solo
+        cambian de texto.
+        """
+        n = self.ga.N
+
+        def fila(textos, bbox, color, weight):
+            table = self.ax_table.table(
+                cellText=[textos], cellLoc='center', loc='center', bbox=bbox
             )
+            table.auto_set_font_size(False)
+            table.set_fontsize(10)
+            for j in range(n):
+                cell = table[(0, j)]
+                cell.set_facecolor(color)
+                cell.set_edgecolor(COLORS['border'])
+                cell.set_text_props(weight=weight, color=COLORS['text_bright'])
+            return table
+
+        fila(self.ga.nombres, [0.1, 0.6, 0.8, 0.3], COLORS['accent'], 'bold')
+        # Tabla de distancias (solo Bellman-Ford)
+        self._dist_table = fila(['∞'] * n, [0.1, 0.3, 0.8, 0.3], COLORS['bg_input'], 'normal')
+
+    def _node_cmap(self, *colores):
+        """
+        Colormap de nodos para una animación: color k = clase k. Se crea
+        una vez por animación; cada frame solo pasa a la colección de nodos
+        un arreglo de clases (uint8) y matplotlib indexa su tabla RGBA, sin
+        volver a interpretar colores.
+        """
+        from matplotlib.colors import ListedColormap
+        return ListedColormap(colores)
 
-        if node_color_fn:
-            colors = [node_color_fn(self.ga.nombres.index(n)) for n in self.ga.G.nodes()]
-        else:
-            colors = [COLORS['node_default']] * len(self.ga.G.nodes())
-        nx.draw_networkx_nodes(
-            self.ga.G, self.ga.pos, node_color=colors, node_size=900,
-            edgecolors='#ffffff33', linewidths=2, ax=ax_graph
-        )
+    def _dist_texts(self, dist):
+        """
+        Textos de un arreglo de distancias (float64) para labels y tabla:
+        el entero o '∞' si el nodo no se ha alcanzado. Se convierten todas
+        juntas con NumPy en lugar de formatear cada float en Python.
+        """
+        alcanzado = np.isfinite(dist)
+        enteros = np.where(alcanzado, dist, 0).astype(np.int64).astype(str)
+        return np.where(alcanzado, enteros, '∞').tolist()
 
-        if label_fn:
-            labels = {n: label_fn(self.ga.nombres.index(n), n) for n in self.ga.G.nodes()}
-        else:
-            labels = {n: n for n in self.ga.G.nodes()}
-        nx.draw_networkx_labels(
-            self.ga.G, self.ga.pos, labels=labels, font_size=11,
-            font_weight='bold', font_color='white', ax=ax_graph
-        )
+    def _tree_edges(self, padre, visitado=None):
+        """
+        Aristas (padre, hijo) del árbol de búsqueda a partir de una fila
+        de padres (-1 = sin padre), opcionalmente solo de los hijos
+        marcados en la máscara bool visitado. Todo con NumPy, sin recorrer
+        nodos.
+        """
+        tiene_padre = padre >= 0
+        if visitado is not None:
+            tiene_padre &= visitado
+        hijos = np.flatnonzero(tiene_padre)
+        return list(zip(padre[hijos].tolist(), hijos.tolist()))
 
-        edge_labels = nx.get_edge_attributes(self.ga.G, 'weight')
-        nx.draw_networkx_edge_labels(
-            self.ga.G, self.ga.pos, edge_labels=edge_labels,
-            font_size=9, font_color=COLORS['text1'],
-            bbox=dict(
-                boxstyle='round,pad=0.3',
-                facecolor=COLORS['bg_card'],
-                edgecolor=COLORS['border'], alpha=0.9
-            ),
-            ax=ax_graph
-        )
+    def _mst_weights(self, pasos):
+        """
+        Peso acumulado del MST parcial en cada paso de Kruskal o Prim. La
+        lista 'mst' de los pasos solo crece, así que la del último paso
+        contiene a todas: sus pesos se leen de la matriz de una vez y el
+        peso del paso t es la suma acumulada hasta len(mst) aristas.
+        Retorna un arreglo float64 con un valor por paso.
+        """
+        mst_final = np.array(pasos[-1]['mst'] if pasos else [], dtype=np.intp).reshape(-1, 2)
+        acumulado = np.concatenate(([0.0], np.cumsum(self.ga.matriz[mst_final[:, 0], mst_final[:, 1]])))
+        return acumulado[[len(p['mst']) for p in pasos]]
 
-        # Títulos
-        self.fig.suptitle(
-            algo_name, fontsize=17, fontweight='bold',
-            color=COLORS['text_bright'], y=0.96
-        )
-        ax_graph.set_title(
-            subtitle, fontsize=11, color=COLORS['text_dim'],
-            pad=10, style='italic'
+    def _visit_classes(self, visitado, actual):
+        """
+        Clases de color de un recorrido: 0 = sin visitar, 1 = visitado,
+        2 = nodo actual. visitado es una fila bool de ColumnasPasos.
+        Retorna un arreglo uint8 de tamaño N.
+        """
+        clases = visitado.astype(np.uint8)
+        clases[actual] = 2
+        return clases
+
+    def _render_frame(self, subtitle, highlight_edges=None, path_edges=None,
+                      eval_edge=None, node_classes=None, node_cmap=None, label_fn=None):
+        """
+        Actualiza los artistas dinámicos para un frame genérico de animación
+        (usado por todos los algoritmos; Bellman-Ford agrega su tabla en
+        _render_bellman_frame). Requiere haber llamado a _draw_static_layers.
+
+        Parámetros:
+            subtitle:        subtítulo con info del paso actual
+            highlight_edges: lista de aristas (índice_u, índice_v) a resaltar
+            path_edges:      aristas del camino final (verde, más gruesas)
+            eval_edge:       tupla (color, [aristas]) para arista siendo evaluada
+            node_classes:    arreglo uint8 (N,) con la clase de color de cada
+                             nodo (por índice), o None para el color por defecto
+            node_cmap:       colormap con el color de cada clase (ver
+                             _node_cmap); el mismo en toda la animación
+            label_fn:        función(índice, nombre) → texto del label del nodo
+
+        Retorna:
+            Lista de artistas a redibujar, en orden de dibujo (para blit).
+        """
+        # Estado del axes del grafo en este frame
+        colors = None if node_classes is None else node_classes.tobytes()
+        if label_fn:
+            labels = [label_fn(i, n) for i, n in self._label_nodes]
+        else:
+            labels = [n for _, n in self._label_nodes]
+        estado = (
+            highlight_edges, path_edges, eval_edge, colors, labels
         )
 
-        # ---- Tabla de distancias (parte inferior) ----
-        if distancias is not None:
-            cell_text = []
-            row_colors = []
+        self._subtitle.set_text(subtitle)
 
-            # Fila 1: nombres de los nodos
-            cell_text.append(self.ga.nombres)
-            row_colors.append(COLORS['accent'])
+        # Si el grafo quedó igual que en el frame anterior (p. ej. en
+        # Bellman-Ford cuando solo cambia la tabla), no se toca su axes:
+        # FuncAnimation hace blit por axes, así que solo se copian el
+        # subtítulo y lo que agregue el llamador
+        if estado == self._last_graph_state:
+            return [self._subtitle]
+        self._last_graph_state = estado
 
-            # Fila 2: distancias (∞ si es infinito)
-            dist_row = []
-            for d in distancias:
-                dist_row.append('∞' if d == float('inf') else str(int(d)))
-            cell_text.append(dist_row)
-            row_colors.append(COLORS['bg_card'])
+        # Capas 2-4 en una sola colección: aristas resaltadas (árbol de
+        # exploración), camino final (verde, gruesas) y arista siendo
+        # evaluada (discontinua)
+        self._set_overlay(highlight_edges, path_edges, eval_edge)
 
-            # Resaltar la columna del nodo destino de la arista evaluada
-            col_colors = [COLORS['bg_input']] * len(self.ga.nombres)
-            if step_data.get('tipo') == 'relajacion' and 'arista_evaluada' in step_data:
-                _, v = step_data['arista_evaluada']
-                col_colors[v] = COLORS['node_current']
+        # Nodos con colores dinámicos según el estado del algoritmo
+        if node_classes is None:
+            self._node_collection.set_array(None)
+        else:
+            if self._node_collection.get_cmap() is not node_cmap:
+                self._node_collection.set_cmap(node_cmap)
+            self._node_collection.set_array(node_classes[self._node_idx])
+
+        # Labels de nodos (pueden incluir distancia, etc.): solo se tocan
+        # los que cambiaron
+        for texto, nuevo in zip(self._node_labels.values(), labels):
+            if texto.get_text() != nuevo:
+                texto.set_text(nuevo)
+
+        # Mismo orden que tenían las capas al redibujar todo el axes:
+        # resaltados, pesos, nodos, etiquetas de nodos
+        return [
+            self._overlay_lc, *self._edge_labels.values(),
+            self._node_collection, *self._node_labels.values(), self._subtitle
+        ]
 
-            # Crear y estilizar la tabla
-            table = ax_table.table(
-                cellText=cell_text, cellLoc='center',
-                loc='center', bbox=[0.1, 0.3, 0.8, 0.6]
-            )
-            table.auto_set_font_size(False)
-            table.set_fontsize(10)
+    def _render_bellman_frame(self, step_data, subtitle, distancias=None, **kwargs):
+        """
+        Renderizador especial para Bellman-Ford: actualiza el grafo igual
+        que _render_frame (mismos parámetros opcionales en kwargs) y la
+        tabla de distancias de la parte inferior de la figura.
+        Requiere _draw_static_layers(..., bellman=True).
 
-            for i in range(len(cell_text)):
-                for j in range(len(self.ga.nombres)):
-                    cell = table[(i, j)]
-                    cell.set_facecolor(row_colors[i] if i == 0 else col_colors[j])
-                    cell.set_edgecolor(COLORS['border'])
-                    cell.set_text_props(
-                        weight='bold' if i == 0 else 'normal',
-                        color=COLORS['text_bright']
-                    )
+        distancias: textos de la fila de distancias (ver _dist_texts)
+        """
+        artistas = self._render_frame(subtitle, **kwargs)
 
-            ax_table.text(
-                0.5, 0.05, 'Distancias desde el origen',
-                ha='center', fontsize=10, color=COLORS['text_dim'],
-                transform=ax_table.transAxes
-            )
+        # ---- Tabla de distancias (parte inferior) ----
+        # La tabla ya existe (_init_dist_table): solo cambian los textos de
+        # la fila de distancias y el color de la columna resaltada
+        if distancias is not None:
+            table = self._dist_table
 
-        # Mantener referencia al axes del grafo para compatibilidad
-        self.ax = ax_graph
+            # Resaltar la columna del nodo destino de la arista evaluada
+            resaltada = None
+            if step_data.get('tipo') == 'relajacion' and 'arista_evaluada' in step_data:
+                _, resaltada = step_data['arista_evaluada']
+
+            textos = distancias
+
+            # Igual que con el grafo: si la tabla no cambió, su axes no se
+            # redibuja ni se copia. Si cambió, solo se tocan las celdas
+            # distintas al frame anterior (None = tabla neutral: todo ∞)
+            if (textos, resaltada) != self._last_table_state:
+                prev_textos, prev_hi = self._last_table_state or (['∞'] * len(textos), None)
+                for j, texto in enumerate(textos):
+                    if texto != prev_textos[j]:
+                        table[(0, j)].get_text().set_text(texto)
+                if resaltada != prev_hi:
+                    if prev_hi is not None:
+                        table[(0, prev_hi)].set_facecolor(COLORS['bg_input'])
+                    if resaltada is not None:
+                        table[(0, resaltada)].set_facecolor(COLORS['node_current'])
+                self._last_table_state = (textos, resaltada)
+                artistas.append(table)
+
+        return artistas
 
     # =================================================================
     # ANIMACIONES POR ALGORITMO
     # =================================================================
 
+    def _get_pasos(self, funcion, *args):
+        """
+        Ejecuta algorithms.<funcion>(ga, *args) o, si ya se ejecutó con los
+        mismos argumentos sobre este grafo, retorna el resultado guardado:
+        repetir una animación no vuelve a correr el algoritmo. La caché se
+        vacía cuando cambia ga.version (otro grafo cargado) y guarda como
+        máximo _MAX_PASOS_CACHE resultados (LRU: el dict conserva el orden
+        de uso, el primero es el menos reciente).
+
+        El resultado se comparte entre ejecuciones, así que no se modifica.
+        """
+        if self._pasos_version != self.ga.version:
+            self._pasos_cache.clear()
+            self._pasos_version = self.ga.version
+        clave = (funcion, args)
+        resultado = self._pasos_cache.pop(clave, None)
+        if resultado is None:
+            resultado = getattr(algorithms, funcion)(self.ga, *args)
+            if len(self._pasos_cache) >= _MAX_PASOS_CACHE:
+                del self._pasos_cache[next(iter(self._pasos_cache))]
+        self._pasos_cache[clave] = resultado     # Al final: el más reciente
+        return resultado
+
     # ------ BFS ------
     def _animate_bfs(self, inicio):
         """Anima BFS paso a paso desde el nodo de inicio."""
-        pasos = bfs_pasos(self.ga, inicio)
+        pasos = self._get_pasos('bfs_pasos', inicio)
+        # Los pasos solo traen deltas: se expanden una vez a arreglos con
+        # una fila por paso, y cada frame solo indexa su fila
+        col = ColumnasPasos(pasos, self.ga.N)
         self.status_var.set(f"BFS desde {self.ga.nombres[inicio]}...")
 
+        self._draw_static_layers(f"BFS — {self.ga.nombre_grafo}")
+        cmap = self._node_cmap(COLORS['node_default'], COLORS['node_visit'], COLORS['node_current'])
+
         def update(frame):
-            p = pasos[frame]
-            # Construir aristas del árbol BFS a partir del dict de padres
-            he = []
-            for nodo in p['visitados']:
-                if p['padre'].get(nodo) is not None:
-                    he.append((self.ga.nombres[p['padre'][nodo]], self.ga.nombres[nodo]))
-
-            def ncf(idx):
-                if idx == p['actual']:     return COLORS['node_current']
-                if idx in p['visitados']:  return COLORS['node_visit']
-                return COLORS['node_default']
-
-            self._render_frame(
-                p, f"BFS — {self.ga.nombre_grafo}",
-                f"Paso {frame+1}/{len(pasos)} | Visitando: {self.ga.nombres[p['actual']]}",
-                highlight_edges=he, node_color_fn=ncf
+            actual, visitado = col.actual[frame], col.visitado[frame]
+            # Aristas del árbol BFS (padres de los nodos ya visitados)
+            he = self._tree_edges(col.padre[frame], visitado)
+
+            artistas = self._render_frame(
+                f"Paso {frame+1}/{len(pasos)} | Visitando: {self.ga.nombres[actual]}",
+                highlight_edges=he, node_cmap=cmap,
+                node_classes=self._visit_classes(visitado, actual)
             )
-            self.canvas.draw_idle()
 
             if frame == len(pasos) - 1:
                 self.status_var.set(f"BFS completado — {len(pasos)} nodos visitados")
+            return artistas
 
-        self.current_anim = FuncAnimation(
-            self.fig, update, frames=len(pasos),
-            interval=self.speed_var.get(), repeat=False
-        )
-        self.canvas.draw()
+        self._start_animation(update, len(pasos))
 
     # ------ DFS ------
     def _animate_dfs(self, inicio):
         """Anima DFS paso a paso desde el nodo de inicio."""
-        pasos = dfs_pasos(self.ga, inicio)
+        pasos = self._get_pasos('dfs_pasos', inicio)
+        col = ColumnasPasos(pasos, self.ga.N)
         self.status_var.set(f"DFS desde {self.ga.nombres[inicio]}...")
 
+        self._draw_static_layers(f"DFS — {self.ga.nombre_grafo}")
+        cmap = self._node_cmap(COLORS['node_default'], COLORS['accent3'], COLORS['orange'])
+
         def update(frame):
-            p = pasos[frame]
-            he = []
-            for nodo in p['visitados']:
-                if p['padre'].get(nodo) is not None:
-                    he.append((self.ga.nombres[p['padre'][nodo]], self.ga.nombres[nodo]))
-
-            def ncf(idx):
-                if idx == p['actual']:     return COLORS['orange']
-                if idx in p['visitados']:  return COLORS['accent3']
-                return COLORS['node_default']
-
-            self._render_frame(
-                p, f"DFS — {self.ga.nombre_grafo}",
-                f"Paso {frame+1}/{len(pasos)} | Visitando: {self.ga.nombres[p['actual']]}",
-                highlight_edges=he, node_color_fn=ncf
+            actual, visitado = col.actual[frame], col.visitado[frame]
+            he = self._tree_edges(col.padre[frame], visitado)
+
+            artistas = self._render_frame(
+                f"Paso {frame+1}/{len(pasos)} | Visitando: {self.ga.nombres[actual]}",
+                highlight_edges=he, node_cmap=cmap,
+                node_classes=self._visit_classes(visitado, actual)
             )
-            self.canvas.draw_idle()
 
             if frame == len(pasos) - 1:
                 self.status_var.set("DFS completado")
+            return artistas
 
-        self.current_anim = FuncAnimation(
-            self.fig, update, frames=len(pasos),
-            interval=self.speed_var.get(), repeat=False
-        )
-        self.canvas.draw()
+        self._start_animation(update, len(pasos))
 
     # ------ DIJKSTRA ------
     def _animate_dijkstra(self, inicio, objetivo):
         """Anima Dijkstra con frame final mostrando el camino más corto."""
-        pasos, camino, dist_final = dijkstra_pasos(self.ga, inicio, objetivo)
+        pasos, camino, dist_final = self._get_pasos('dijkstra_pasos', inicio, objetivo)
         total = len(pasos)
 
-        # Agregar un frame extra para mostrar el resultado final
+        # Agregar un frame extra para mostrar el resultado final (en una
+        # lista nueva: la de _get_pasos queda en caché para otra ejecución)
         if camino and len(camino) > 1:
-            pasos.append({
-                'final': True, 'camino': camino,
-                'dist': dist_final, 'padre': pasos[-1]['padre']
-            })
+            pasos = pasos + [{
+                'final': True, 'camino': camino, 'dist': dist_final
+            }]
+        col = ColumnasPasos(pasos, self.ga.N)
 
         self.status_var.set(f"Dijkstra: {self.ga.nombres[inicio]} → {self.ga.nombres[objetivo]}...")
 
+        self._draw_static_layers(f"Dijkstra — {self.ga.nombre_grafo}")
+        # Clases: 0-2 como _visit_classes, 3 = destino, 4 = camino final
+        cmap = self._node_cmap(
+            COLORS['node_default'], COLORS['node_visit'], COLORS['node_current'],
+            COLORS['orange'], COLORS['green']
+        )
+
         def update(frame):
             p = pasos[frame]
             is_final = p.get('final', False)
@@ -929,171 +1354,159 @@ class App(tk.Tk):
             if is_final:
                 # Frame final: mostrar camino en verde
                 cf = p['camino']
-                pe = [(self.ga.nombres[cf[i]], self.ga.nombres[cf[i+1]]) for i in range(len(cf)-1)]
+                pe = list(zip(cf[:-1], cf[1:]))
+
+                clases = np.zeros(self.ga.N, dtype=np.uint8)
+                clases[cf] = 4
 
-                def ncf(idx):
-                    return COLORS['green'] if idx in cf else COLORS['node_default']
+                dist_txt = self._dist_texts(p['dist'])
 
                 def lf(idx, n):
-                    d = p['dist'][idx]
-                    return f"{n}\n({int(d)})" if d != float('inf') else f"{n}\n(∞)"
+                    return f"{n}\n({dist_txt[idx]})"
 
                 cost = int(dist_final[objetivo]) if dist_final[objetivo] != float('inf') else '∞'
                 camino_str = " → ".join([self.ga.nombres[n] for n in cf])
 
-                self._render_frame(
-                    p, f"Dijkstra — {self.ga.nombre_grafo}",
+                artistas = self._render_frame(
                     f"✓ {camino_str} | Costo: {cost}",
-                    path_edges=pe, node_color_fn=ncf, label_fn=lf
+                    path_edges=pe, node_classes=clases, node_cmap=cmap, label_fn=lf
                 )
                 self.status_var.set(f"✓ Ruta: {camino_str} — Costo: {cost}")
             else:
                 # Frames de exploración
-                he = []
-                for nodo in p['visitados']:
-                    if p['padre'].get(nodo) is not None:
-                        he.append((self.ga.nombres[p['padre'][nodo]], self.ga.nombres[nodo]))
+                actual, visitado = col.actual[frame], col.visitado[frame]
+                he = self._tree_edges(col.padre[frame], visitado)
 
-                def ncf(idx):
-                    if idx == objetivo:    return COLORS['orange']
-                    if idx == p['actual']: return COLORS['node_current']
-                    if idx in p['visitados']: return COLORS['node_visit']
-                    return COLORS['node_default']
+                clases = self._visit_classes(visitado, actual)
+                clases[objetivo] = 3
+
+                dist_txt = self._dist_texts(col.dist[frame])
 
                 def lf(idx, n):
-                    d = p['dist'][idx]
-                    return f"{n}\n({int(d)})" if d != float('inf') else f"{n}\n(∞)"
+                    return f"{n}\n({dist_txt[idx]})"
 
-                self._render_frame(
-                    p, f"Dijkstra — {self.ga.nombre_grafo}",
-                    f"Paso {frame+1}/{total} | Procesando: {self.ga.nombres[p['actual']]}",
-                    highlight_edges=he, node_color_fn=ncf, label_fn=lf
+                artistas = self._render_frame(
+                    f"Paso {frame+1}/{total} | Procesando: {self.ga.nombres[actual]}",
+                    highlight_edges=he, node_classes=clases, node_cmap=cmap, label_fn=lf
                 )
-            self.canvas.draw_idle()
+            return artistas
 
-        self.current_anim = FuncAnimation(
-            self.fig, update, frames=len(pasos),
-            interval=self.speed_var.get(), repeat=False
-        )
-        self.canvas.draw()
+        self._start_animation(update, len(pasos))
 
     # ------ A* ------
     def _animate_astar(self, inicio, objetivo):
         """Anima A* con frame final mostrando el camino encontrado."""
-        pasos, camino, g_final = a_star_pasos(self.ga, inicio, objetivo)
+        pasos, camino, g_final = self._get_pasos('a_star_pasos', inicio, objetivo)
         total = len(pasos)
 
         if camino and len(camino) > 1:
-            pasos.append({
-                'final': True, 'camino': camino,
-                'g': g_final, 'padre': pasos[-1]['padre']
-            })
+            pasos = pasos + [{
+                'final': True, 'camino': camino, 'g': g_final
+            }]
+        col = ColumnasPasos(pasos, self.ga.N)
 
         self.status_var.set(f"A*: {self.ga.nombres[inicio]} → {self.ga.nombres[objetivo]}...")
 
+        self._draw_static_layers(f"A* — {self.ga.nombre_grafo}")
+        # Clases: 0-2 como _visit_classes, 3 = destino, 4 = camino final
+        cmap = self._node_cmap(
+            COLORS['node_default'], '#0077b6', COLORS['teal'], COLORS['orange'], COLORS['green']
+        )
+
         def update(frame):
             p = pasos[frame]
             is_final = p.get('final', False)
 
             if is_final:
                 cf = p['camino']
-                pe = [(self.ga.nombres[cf[i]], self.ga.nombres[cf[i+1]]) for i in range(len(cf)-1)]
+                pe = list(zip(cf[:-1], cf[1:]))
 
-                def ncf(idx):
-                    return COLORS['green'] if idx in cf else COLORS['node_default']
+                clases = np.zeros(self.ga.N, dtype=np.uint8)
+                clases[cf] = 4
 
                 cost = int(g_final.get(objetivo, 0))
                 camino_str = " → ".join([self.ga.nombres[n] for n in cf])
 
-                self._render_frame(
-                    p, f"A* — {self.ga.nombre_grafo}",
+                artistas = self._render_frame(
                     f"✓ {camino_str} | Costo: {cost}",
-                    path_edges=pe, node_color_fn=ncf
+                    path_edges=pe, node_classes=clases, node_cmap=cmap
                 )
                 self.status_var.set(f"✓ Ruta: {camino_str} — Costo: {cost}")
             else:
-                he = []
-                for nodo in p['visitados']:
-                    if p['padre'].get(nodo) is not None:
-                        he.append((self.ga.nombres[p['padre'][nodo]], self.ga.nombres[nodo]))
-
-                def ncf(idx):
-                    if idx == objetivo:    return COLORS['orange']
-                    if idx == p['actual']: return COLORS['teal']
-                    if idx in p['visitados']: return '#0077b6'
-                    return COLORS['node_default']
-
-                self._render_frame(
-                    p, f"A* — {self.ga.nombre_grafo}",
-                    f"Paso {frame+1}/{total} | Explorando: {self.ga.nombres[p['actual']]}",
-                    highlight_edges=he, node_color_fn=ncf
+                actual, visitado = col.actual[frame], col.visitado[frame]
+                he = self._tree_edges(col.padre[frame], visitado)
+
+                clases = self._visit_classes(visitado, actual)
+                clases[objetivo] = 3
+
+                artistas = self._render_frame(
+                    f"Paso {frame+1}/{total} | Explorando: {self.ga.nombres[actual]}",
+                    highlight_edges=he, node_classes=clases, node_cmap=cmap
                 )
-            self.canvas.draw_idle()
+            return artistas
 
-        self.current_anim = FuncAnimation(
-            self.fig, update, frames=len(pasos),
-            interval=self.speed_var.get(), repeat=False
-        )
-        self.canvas.draw()
+        self._start_animation(update, len(pasos))
 
     # ------ BELLMAN-FORD ------
     def _animate_bellman(self, origen, objetivo):
         """Anima Bellman-Ford con tabla de distancias debajo del grafo."""
-        pasos, camino, dist_final = bellman_ford_pasos(self.ga, origen, objetivo)
+        pasos, camino, dist_final = self._get_pasos('bellman_ford_pasos', origen, objetivo)
 
         if camino and len(camino) > 1:
-            pasos.append({'final': True, 'camino': camino, 'dist': dist_final})
+            pasos = pasos + [{'final': True, 'camino': camino, 'dist': dist_final}]
+        col = ColumnasPasos(pasos, self.ga.N)
 
         self.status_var.set(f"Bellman-Ford: {self.ga.nombres[origen]} → {self.ga.nombres[objetivo]}...")
 
+        self._draw_static_layers(f"Bellman-Ford — {self.ga.nombre_grafo}", bellman=True)
+        # Clases: 0 = normal, 1 = destino de la arista evaluada,
+        # 2 = su origen, 3 = camino final
+        cmap = self._node_cmap(
+            COLORS['node_default'], COLORS['node_current'], COLORS['accent'], COLORS['green']
+        )
+
         def update(frame):
             p = pasos[frame]
             is_final = p.get('final', False)
 
             if is_final:
                 cf = p['camino']
-                pe = [(self.ga.nombres[cf[i]], self.ga.nombres[cf[i+1]]) for i in range(len(cf)-1)]
+                pe = list(zip(cf[:-1], cf[1:]))
 
-                def ncf(idx):
-                    return COLORS['green'] if idx in cf else COLORS['node_default']
+                clases = np.zeros(self.ga.N, dtype=np.uint8)
+                clases[cf] = 3
+
+                dist_txt = self._dist_texts(p['dist'])
 
                 def lf(idx, n):
-                    d = p['dist'][idx]
-                    return f"{n}\n({int(d)})" if d != float('inf') else f"{n}\n(∞)"
+                    return f"{n}\n({dist_txt[idx]})"
 
                 cost = int(dist_final[objetivo]) if dist_final[objetivo] != float('inf') else '∞'
                 camino_str = " → ".join([self.ga.nombres[n] for n in cf])
 
-                self._render_bellman_frame(
-                    p, f"Bellman-Ford — {self.ga.nombre_grafo}",
-                    f"✓ {camino_str} | Costo: {cost}",
-                    path_edges=pe, node_color_fn=ncf, label_fn=lf,
-                    distancias=p['dist']
+                artistas = self._render_bellman_frame(
+                    p, f"✓ {camino_str} | Costo: {cost}",
+                    path_edges=pe, node_classes=clases, node_cmap=cmap, label_fn=lf,
+                    distancias=dist_txt
                 )
                 self.status_var.set(f"✓ Ruta: {camino_str} — Costo: {cost}")
             else:
                 # Aristas del árbol de padres
-                he = []
-                for nodo in p['padre']:
-                    if p['padre'][nodo] is not None:
-                        he.append((self.ga.nombres[p['padre'][nodo]], self.ga.nombres[nodo]))
+                he = self._tree_edges(col.padre[frame])
 
-                # Arista siendo evaluada (discontinua naranja)
+                # Arista siendo evaluada (discontinua naranja) y sus nodos
                 eval_edge = None
+                clases = np.zeros(self.ga.N, dtype=np.uint8)
                 if p['tipo'] == 'relajacion' and 'arista_evaluada' in p:
                     u, v = p['arista_evaluada']
-                    eval_edge = (COLORS['orange'], [(self.ga.nombres[u], self.ga.nombres[v])])
+                    eval_edge = (COLORS['orange'], [(u, v)])
+                    clases[u] = 2
+                    clases[v] = 1
 
-                def lf(idx, n):
-                    d = p['dist'][idx]
-                    return f"{n}\n({int(d)})" if d != float('inf') else f"{n}\n(∞)"
+                dist_txt = self._dist_texts(col.dist[frame])
 
-                def ncf(idx):
-                    if p['tipo'] == 'relajacion' and 'arista_evaluada' in p:
-                        u, v = p['arista_evaluada']
-                        if idx == v: return COLORS['node_current']
-                        if idx == u: return COLORS['accent']
-                    return COLORS['node_default']
+                def lf(idx, n):
+                    return f"{n}\n({dist_txt[idx]})"
 
                 # Subtítulo detallado
                 if p['tipo'] == 'relajacion':
@@ -1108,83 +1521,70 @@ class App(tk.Tk):
                 else:
                     sub = f"Iteración {p['iter']} | Sin cambios (convergencia alcanzada)"
 
-                self._render_bellman_frame(
-                    p, f"Bellman-Ford — {self.ga.nombre_grafo}",
-                    sub, highlight_edges=he, label_fn=lf,
-                    eval_edge=eval_edge, node_color_fn=ncf, distancias=p['dist']
+                artistas = self._render_bellman_frame(
+                    p, sub, highlight_edges=he, label_fn=lf,
+                    eval_edge=eval_edge, node_classes=clases, node_cmap=cmap, distancias=dist_txt
                 )
-            self.canvas.draw_idle()
+            return artistas
 
-        self.current_anim = FuncAnimation(
-            self.fig, update, frames=len(pasos),
-            interval=self.speed_var.get(), repeat=False
-        )
-        self.canvas.draw()
+        self._start_animation(update, len(pasos))
 
     # ------ KRUSKAL ------
     def _animate_kruskal(self):
         """Anima Kruskal mostrando cada arista evaluada (aceptada/rechazada)."""
-        pasos = kruskal_pasos(self.ga)
+        pasos = self._get_pasos('kruskal_pasos')
+        peso_mst = self._mst_weights(pasos)
         self.status_var.set("Kruskal MST...")
 
+        self._draw_static_layers(f"Kruskal — {self.ga.nombre_grafo}")
+
         def update(frame):
             p = pasos[frame]
             # Aristas ya aceptadas en el MST
-            mst_e = [(self.ga.nombres[u], self.ga.nombres[v]) for u, v in p['mst']]
+            mst_e = p['mst']
             # Arista que se está evaluando en este paso
             u, v = p['edge']
-            eval_e = [(self.ga.nombres[u], self.ga.nombres[v])]
+            eval_e = [(u, v)]
             # Verde si aceptada, rojo si rechazada (formaría ciclo)
             color_e = COLORS['green'] if p['ok'] else COLORS['accent']
             estado = "✓ Aceptada" if p['ok'] else "✗ Rechazada (ciclo)"
 
-            self._render_frame(
-                p, f"Kruskal — {self.ga.nombre_grafo}",
+            artistas = self._render_frame(
                 f"Paso {frame+1}/{len(pasos)} | {self.ga.nombres[u]}-{self.ga.nombres[v]} "
                 f"(peso {p['w']}) | {estado}",
                 highlight_edges=mst_e, eval_edge=(color_e, eval_e)
             )
-            self.canvas.draw_idle()
 
             if frame == len(pasos) - 1:
-                peso_total = sum(self.ga.matriz[u][v] for u, v in p['mst'])
-                self.status_var.set(f"✓ MST Kruskal — Peso total: {int(peso_total)}")
+                self.status_var.set(f"✓ MST Kruskal — Peso total: {int(peso_mst[frame])}")
+            return artistas
 
-        self.current_anim = FuncAnimation(
-            self.fig, update, frames=len(pasos),
-            interval=self.speed_var.get(), repeat=False
-        )
-        self.canvas.draw()
+        self._start_animation(update, len(pasos))
 
     # ------ PRIM ------
     def _animate_prim(self):
         """Anima Prim mostrando cómo crece el MST nodo a nodo."""
-        pasos = prim_pasos(self.ga)
+        pasos = self._get_pasos('prim_pasos')
+        col = ColumnasPasos(pasos, self.ga.N)
+        peso_mst = self._mst_weights(pasos)
         self.status_var.set("Prim MST...")
 
+        self._draw_static_layers(f"Prim — {self.ga.nombre_grafo}")
+        cmap = self._node_cmap(COLORS['node_default'], '#16a085', COLORS['green'])
+
         def update(frame):
             p = pasos[frame]
-            mst_e = [(self.ga.nombres[u], self.ga.nombres[v]) for u, v in p['mst']]
+            mst_e = p['mst']
 
-            def ncf(idx):
-                if idx == p['actual']:        return COLORS['green']
-                if idx in p['visitados']:     return '#16a085'
-                return COLORS['node_default']
-
-            self._render_frame(
-                p, f"Prim — {self.ga.nombre_grafo}",
+            artistas = self._render_frame(
                 f"Paso {frame+1}/{len(pasos)} | Agregando: {self.ga.nombres[p['actual']]} | "
                 f"Aristas MST: {len(p['mst'])}",
-                highlight_edges=mst_e, node_color_fn=ncf
+                highlight_edges=mst_e, node_cmap=cmap,
+                node_classes=self._visit_classes(col.visitado[frame], p['actual'])
             )
-            self.canvas.draw_idle()
 
             if frame == len(pasos) - 1:
-                peso_total = sum(self.ga.matriz[u][v] for u, v in p['mst'])
-                self.status_var.set(f"✓ MST Prim — Peso total: {int(peso_total)}")
+                self.status_var.set(f"✓ MST Prim — Peso total: {int(peso_mst[frame])}")
+            return artistas
 
-        self.current_anim = FuncAnimation(
-            self.fig, update, frames=len(pasos),
-            interval=self.speed_var.get(), repeat=False
-        )
-        self.canvas.draw()
+        self._start_animation(update, len(pasos))
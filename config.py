@@ -6,21 +6,19 @@
 # o agregar grafos predeterminados, solo se modifica este archivo.
 # =====================================================================
 
-import matplotlib
-import matplotlib.pyplot as plt
-
-# Forzar backend TkAgg para que matplotlib dibuje dentro de Tkinter
-matplotlib.use('TkAgg')
-
-
 # =====================================================================
 # CONFIGURACIÓN DE MATPLOTLIB
 # =====================================================================
-# Estas opciones definen el estilo oscuro general de las figuras.
-plt.rcParams['figure.facecolor'] = '#1a1a2e'   # Fondo de la figura
-plt.rcParams['axes.facecolor']   = '#16213e'   # Fondo del área de dibujo
-plt.rcParams['font.family']      = 'sans-serif'
-plt.rcParams['font.sans-serif']  = ['DejaVu Sans', 'Arial']
+# Estas opciones definen el estilo oscuro general de las figuras. Este
+# módulo no importa matplotlib: App._build_canvas aplica el backend y
+# estos rcParams al crear la figura (así importar config es gratuito).
+MPL_BACKEND = 'TkAgg'   # Backend para que matplotlib dibuje dentro de Tkinter
+MPL_RCPARAMS = {
+    'figure.facecolor': '#1a1a2e',   # Fondo de la figura
+    'axes.facecolor':   '#16213e',   # Fondo del área de dibujo
+    'font.family':      'sans-serif',
+    'font.sans-serif':  ['DejaVu Sans', 'Arial'],
+}
 
 
 # =====================================================================
@@ -66,6 +64,17 @@ COLORS = {
 }
 
 
+# =====================================================================
+# ANIMACIÓN
+# =====================================================================
+# Tope de frames por segundo que se dibujan, independiente del
+# intervalo elegido con el slider de velocidad: si los frames llegan
+# más seguido (por ejemplo tras una pausa del event loop), los que
+# sobran no se dibujan. El último frame siempre se dibuja.
+# =====================================================================
+MAX_FPS = 30
+
+
 # =====================================================================
 # GRAFOS DE EJEMPLO
 # =====================================================================
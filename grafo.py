@@ -7,12 +7,22 @@
 #   - Funciones auxiliares para convertir entre representaciones
 #     (matriz → aristas, matriz → lista de adyacencia, etc.).
 #   - Carga de grafos desde archivos JSON.
+#   - Caché en disco de las posiciones de dibujo (pos_cache/).
 # =====================================================================
 
+import os
 import math
 import json
+import hashlib
 import numpy as np
-import networkx as nx
+
+
+# Parámetros del layout spring (semilla fija = reproducible). Son parte
+# de la clave de la caché de posiciones: cambiarlos invalida lo guardado
+LAYOUT_SPRING = {'seed': 42, 'k': 2, 'iterations': 50}
+
+# Carpeta de la caché de posiciones (un JSON por grafo)
+DIR_CACHE_POS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pos_cache')
 
 
 class GrafoActivo:
@@ -25,7 +35,14 @@ class GrafoActivo:
         N (int):                     Número de nodos.
         G (nx.Graph | None):         Representación NetworkX del grafo.
         pos (dict | None):           Posiciones {nodo: (x, y)} para dibujo.
+        pos_array (np.ndarray | None): Las mismas posiciones como arreglo (N, 2)
+                                     en el orden de 'nombres'.
+        name_to_idx (dict | None):   {nombre: índice} (evita nombres.index).
         nombre_grafo (str):          Nombre descriptivo del grafo cargado.
+        indptr, indices, weights:    Matriz en formato CSR (ver ensure_csr),
+                                     usada para recorrer solo los vecinos reales.
+        version (int):               Se incrementa cada vez que cambia el grafo;
+                                     invalida las representaciones memoizadas.
     """
 
     def __init__(self):
@@ -34,7 +51,11 @@ class GrafoActivo:
         self.N = 0
         self.G = None
         self.pos = None
+        self.pos_array = None
+        self.name_to_idx = None
         self.nombre_grafo = ""
+        self.version = 0
+        self._memo = {}              # {clave: (version, valor)}
 
     def cargar(self, matriz, nombres, nombre_grafo="Personalizado"):
         """
@@ -46,25 +67,107 @@ class GrafoActivo:
             nombres:      Lista de strings con las etiquetas de los nodos.
             nombre_grafo: Texto descriptivo que se muestra en la interfaz.
         """
+        # Copia propia como ndarray 2D: las filas son vistas contiguas
+        # y cada celda se lee con matriz[i, j] (sin doble indexación).
         self.matriz = np.array(matriz)
         self.nombres = nombres
+        self.name_to_idx = {n: i for i, n in enumerate(nombres)}
         self.N = len(matriz)
         self.nombre_grafo = nombre_grafo
+        self.version += 1            # Invalida la CSR y todo lo derivado de ella
+
+        # Import diferido: NetworkX solo se carga al construir un grafo
+        # (leer un JSON o correr los algoritmos no lo necesita)
+        import networkx as nx
 
         # Construir el grafo NetworkX a partir de la parte superior
         # de la matriz (es simétrica, así evitamos aristas duplicadas).
         self.G = nx.Graph()
-        for i in range(self.N):
-            for j in range(i + 1, self.N):
-                if self.matriz[i][j] > 0:
-                    self.G.add_edge(
-                        self.nombres[i],
-                        self.nombres[j],
-                        weight=int(self.matriz[i][j])
-                    )
-
-        # Calcular posiciones con layout spring (semilla fija = reproducible)
-        self.pos = nx.spring_layout(self.G, seed=42, k=2, iterations=50)
+        filas, columnas = np.nonzero(np.triu(self.matriz > 0, k=1))
+        for i, j in zip(filas.tolist(), columnas.tolist()):
+            self.G.add_edge(
+                self.nombres[i],
+                self.nombres[j],
+                weight=int(self.matriz[i, j])
+            )
+
+        # Posiciones con layout spring (desde la caché en disco si este
+        # mismo grafo ya se cargó antes)
+        self.pos = layout_cacheado(self.G, self.matriz, nombres)
+        # Fila i = posición del nodo i; los nodos aislados no están en G
+        # (no se dibujan) y quedan en NaN
+        self.pos_array = np.array(
+            [self.pos.get(n, (np.nan, np.nan)) for n in nombres], dtype=float
+        ).reshape(self.N, 2)
+
+    def vecinos(self, u):
+        """
+        Retorna (índices, pesos) de los vecinos de u como vistas de la CSR.
+        Ambos arreglos están ordenados por índice de vecino.
+        """
+        indptr, indices, weights = self.ensure_csr()
+        ini, fin = indptr[u], indptr[u + 1]
+        return indices[ini:fin], weights[ini:fin]
+
+    # -----------------------------------------------------------------
+    # Representaciones derivadas (memoizadas por versión del grafo)
+    # -----------------------------------------------------------------
+    def _memoizado(self, clave, calcular):
+        """Retorna calcular() memoizado mientras no cambie self.version."""
+        version, valor = self._memo.get(clave, (None, None))
+        if version != self.version:
+            valor = calcular()
+            self._memo[clave] = (self.version, valor)
+        return valor
+
+    def ensure_csr(self):
+        """
+        Retorna (indptr, indices, weights) de la matriz actual.
+        Es la única pasada O(N²) sobre la matriz: se construye la primera
+        vez que se pide y las demás representaciones se derivan de ella.
+        """
+        return self._memoizado('csr', lambda: matriz_a_csr(self.matriz))
+
+    @property
+    def indptr(self):
+        return self.ensure_csr()[0]
+
+    @property
+    def indices(self):
+        return self.ensure_csr()[1]
+
+    @property
+    def weights(self):
+        return self.ensure_csr()[2]
+
+    def aristas(self):
+        """Lista de aristas (u, v, peso), derivada de la CSR. No modificar."""
+        return self._memoizado('aristas', lambda: csr_a_aristas(*self.ensure_csr()))
+
+    def lista_ady(self):
+        """Lista de adyacencia, derivada de la CSR. No modificar."""
+        return self._memoizado('lista_ady', lambda: csr_a_lista_ady(*self.ensure_csr()))
+
+    def edge_labels(self):
+        """{(nombre_u, nombre_v): peso} de las aristas de G, para dibujar. No modificar."""
+        import networkx as nx
+        return self._memoizado('edge_labels', lambda: nx.get_edge_attributes(self.G, 'weight'))
+
+    def nodes_list(self):
+        """Nombres de los nodos en el orden de G.nodes() (el del dibujo). No modificar."""
+        return self._memoizado('nodes_list', lambda: list(self.G.nodes()))
+
+    def coords(self):
+        """generar_coords(N), calculada una vez por grafo. No modificar."""
+        return self._memoizado('coords', lambda: generar_coords(self.N))
+
+    def heuristica(self, tipo='euclidiana'):
+        """
+        Matriz (N, N) float64 con H[u, v] = distancia entre las coordenadas
+        de u y v ('euclidiana' o 'manhattan'), calculada una vez por grafo
+        y tipo. La fila H[objetivo] es la heurística de A*. No modificar.
+        """
+        return self._memoizado(('heuristica', tipo), lambda: matriz_heuristica(self.coords(), tipo))
 
     @property
     def loaded(self):
@@ -82,26 +185,53 @@ def matriz_a_aristas(m):
     Incluye ambas direcciones (u→v y v→u) porque Bellman-Ford
     necesita considerar todas las aristas dirigidas.
     """
-    return [
-        (i, j, m[i][j])
-        for i in range(len(m))
-        for j in range(len(m))
-        if m[i][j] != 0
-    ]
+    return csr_a_aristas(*matriz_a_csr(m))
 
 
 def matriz_a_lista_ady(m):
     """
     Convierte una matriz de adyacencia en lista de adyacencia.
     Retorna: lista donde lista[i] = [(vecino_j, peso), ...]
-    Usada por el algoritmo de Prim.
     """
-    lista = [[] for _ in range(len(m))]
-    for i in range(len(m)):
-        for j in range(len(m)):
-            if m[i][j] != 0:
-                lista[i].append((j, m[i][j]))
-    return lista
+    return csr_a_lista_ady(*matriz_a_csr(m))
+
+
+def matriz_a_csr(m):
+    """
+    Convierte una matriz de adyacencia en formato CSR (Compressed Sparse Row).
+    Retorna (indptr, indices, weights) donde los vecinos del nodo i son
+    indices[indptr[i]:indptr[i+1]] y sus pesos weights[indptr[i]:indptr[i+1]].
+    Incluye todas las entradas distintas de 0, igual que matriz_a_aristas.
+    """
+    m = np.asarray(m)
+    n = len(m)
+    filas, columnas = np.nonzero(m)          # Orden por fila, luego por columna
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(filas, minlength=n), out=indptr[1:])
+    indices = columnas.astype(np.int32)
+    weights = m[filas, columnas]
+    return indptr, indices, weights
+
+
+def csr_a_aristas(indptr, indices, weights):
+    """
+    Lista de aristas (u, v, peso) a partir de una CSR, en el mismo orden
+    (por fila y luego por columna) que matriz_a_aristas.
+    """
+    origenes = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    return list(zip(origenes.tolist(), indices.tolist(), weights.tolist()))
+
+
+def csr_a_lista_ady(indptr, indices, weights):
+    """
+    Lista de adyacencia a partir de una CSR: lista[i] = [(vecino_j, peso), ...]
+    """
+    vecinos, pesos = indices.tolist(), weights.tolist()
+    limites = indptr.tolist()
+    return [
+        list(zip(vecinos[ini:fin], pesos[ini:fin]))
+        for ini, fin in zip(limites[:-1], limites[1:])
+    ]
 
 
 def generar_coords(n):
@@ -109,12 +239,69 @@ def generar_coords(n):
     Genera coordenadas en cuadrícula para n nodos.
     Se usan como posiciones ficticias para la heurística de A*
     (distancia euclidiana entre posiciones en la cuadrícula).
+
+    Retorna: np.ndarray (n, 2) int32 donde la fila i es (columna, fila)
+    del nodo i.
     """
-    coords = {}
     columnas = math.ceil(math.sqrt(n))
-    for i in range(n):
-        coords[i] = (i % columnas, i // columnas)
-    return coords
+    idx = np.arange(n)
+    return np.stack([idx % columnas, idx // columnas], axis=1).astype(np.int32)
+
+
+def matriz_heuristica(coords, tipo='euclidiana'):
+    """
+    Distancias entre todos los pares de coordenadas (N, 2): euclidiana
+    (np.hypot) o Manhattan (suma de diferencias absolutas).
+    Retorna un np.ndarray (N, N) float64 simétrico.
+    """
+    c = coords.astype(np.float64)
+    dx = c[:, 0:1] - c[:, 0:1].T
+    dy = c[:, 1:2] - c[:, 1:2].T
+    if tipo == 'manhattan':
+        return np.abs(dx) + np.abs(dy)
+    return np.hypot(dx, dy)
+
+
+# =====================================================================
+# CACHÉ DE POSICIONES
+# =====================================================================
+
+def layout_cacheado(G, matriz, nombres):
+    """
+    Posiciones {nombre: (x, y)} de spring_layout para G, guardadas en
+    DIR_CACHE_POS con una clave que resume la matriz, los nombres y
+    LAYOUT_SPRING. El layout cuesta O(iteraciones · N²) y con la semilla
+    fija siempre da lo mismo, así que solo se calcula la primera vez que
+    se carga cada grafo.
+
+    Los nodos aislados (no están en G) no tienen posición. Si la carpeta
+    no se puede leer o escribir, simplemente se calcula el layout.
+    """
+    matriz = np.ascontiguousarray(matriz)
+    clave = hashlib.blake2b(digest_size=8)
+    clave.update(f"{matriz.dtype.str}{matriz.shape}".encode())
+    clave.update(matriz.tobytes())
+    clave.update(json.dumps([list(map(str, nombres)), LAYOUT_SPRING]).encode())
+    ruta = os.path.join(DIR_CACHE_POS, clave.hexdigest() + '.json')
+
+    # Se guarda una lista en el orden de 'nombres' (None = nodo aislado)
+    try:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            guardadas = json.load(f)
+        if len(guardadas) == len(nombres):
+            return {n: tuple(xy) for n, xy in zip(nombres, guardadas) if xy is not None}
+    except (OSError, ValueError):
+        pass
+
+    import networkx as nx
+    pos = {n: tuple(xy.tolist()) for n, xy in nx.spring_layout(G, **LAYOUT_SPRING).items()}
+    try:
+        os.makedirs(DIR_CACHE_POS, exist_ok=True)
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump([pos.get(n) for n in nombres], f)
+    except OSError:
+        pass
+    return pos
 
 
 # =====================================================================
@@ -134,7 +321,8 @@ def cargar_desde_json(ruta):
          → Lista de aristas. Se construye la matriz internamente.
 
     Retorna:
-        (matriz, nombres, None)       si todo salió bien.
+        (matriz, nombres, None)       si todo salió bien (matriz como
+                                      np.ndarray NxN simétrico).
         (None, None, mensaje_error)   si hubo algún problema.
     """
     try:
@@ -151,13 +339,10 @@ def cargar_desde_json(ruta):
                 if len(fila) != n:
                     return None, None, "La matriz no es cuadrada"
 
-            # Forzar simetría (tomar el mayor de los dos valores)
-            for i in range(n):
-                for j in range(n):
-                    if matriz[i][j] != matriz[j][i]:
-                        val = max(matriz[i][j], matriz[j][i])
-                        matriz[i][j] = val
-                        matriz[j][i] = val
+            # Forzar simetría (tomar el mayor de los dos valores), en una
+            # sola operación de NumPy sobre toda la matriz
+            m = np.array(matriz)
+            matriz = np.maximum(m, m.T)
 
             # Generar nombres por defecto si no se proporcionan
             nombres = data.get("nombres", None)
@@ -170,23 +355,31 @@ def cargar_desde_json(ruta):
 
         # ----- Formato 2: Lista de aristas -----
         elif "aristas" in data:
-            # Recopilar todos los nodos mencionados
-            nodos = set()
-            for a in data["aristas"]:
-                nodos.add(str(a["origen"]))
-                nodos.add(str(a["destino"]))
-
-            nombres = sorted(list(nodos))
-            idx = {nombre: i for i, nombre in enumerate(nombres)}
+            aristas = data["aristas"]
+            m = len(aristas)
+            origenes = [str(a["origen"]) for a in aristas]
+            destinos = [str(a["destino"]) for a in aristas]
+            pesos = np.array([a.get("peso", 1) for a in aristas])
+
+            # Nombres ordenados de todos los nodos mencionados y, en la
+            # misma pasada, el índice de cada extremo de cada arista
+            nombres, inv = np.unique(origenes + destinos, return_inverse=True)
+            nombres = nombres.tolist()
+            u, v = inv[:m], inv[m:]
             n = len(nombres)
 
-            # Construir la matriz de adyacencia
-            matriz = [[0] * n for _ in range(n)]
-            for a in data["aristas"]:
-                u, v = idx[str(a["origen"])], idx[str(a["destino"])]
-                peso = a.get("peso", 1)
-                matriz[u][v] = peso
-                matriz[v][u] = peso  # Grafo no dirigido
+            # Una arista repetida (en cualquier sentido) vale por su última
+            # aparición: se busca la primera de cada par {u, v} en el orden
+            # invertido, así la asignación no tiene índices duplicados
+            clave = (np.minimum(u, v) * n + np.maximum(u, v))[::-1]
+            _, primera = np.unique(clave, return_index=True)
+            ultima = m - 1 - primera
+            u, v, pesos = u[ultima], v[ultima], pesos[ultima]
+
+            # Construir la matriz de adyacencia (grafo no dirigido) con una
+            # sola asignación: u→v y v→u
+            matriz = np.zeros((n, n), dtype=pesos.dtype)
+            matriz[np.concatenate([u, v]), np.concatenate([v, u])] = np.concatenate([pesos, pesos])
 
             return matriz, nombres, None
 